@@ -0,0 +1,164 @@
+# -*- coding: utf-8 -*-
+
+"""
+Benchmark of the calendar conversions of datetime_util.
+
+Converts a series of timestamps with the pure-integer functions and with the
+time module, checks that both agree and reports the time per conversion:
+
+    timetuple      : datetime_util.timetuple()  vs time.gmtime()
+    timestamp      : datetime_util.timestamp()  vs time.mktime()
+    get_timetuple  : datetime_util.get_timetuple() vs its former month table
+    cettime        : datetime_util.cettime() via tz_util.CET vs its former
+                     mktime() and localtime() version, for random and for
+                     consecutive timestamps, the latter hitting the cache of
+                     the offset like the clock does
+
+Run with CPython from the repository root:
+
+    python bench/bench_datetime.py [--count 100000] [--epoch 1970]
+
+With `--epoch 2000` the timestamps count from 2000-01-01 as on the ESP32,
+and the time module is fed timestamps shifted to its own epoch. time.mktime()
+converts local time, so it runs with TZ=UTC. cettime() depends on the epoch
+of the host, so it always converts timestamps since 1970.
+
+@author: mada
+@version: 2026-10-17
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path[:0] = [os.path.join(ROOT, 'src')]
+
+import datetime_util  # noqa: E402
+
+##*****************************************************************************
+##*****************************************************************************
+
+EPOCH_DAYS = {1970: 0, 2000: 10957}
+
+
+##=============================================================================
+def get_timetuple_table(short_time_tuple):
+    '''
+    datetime_util.get_timetuple() before the pure-integer conversions, with
+    the month table built and summed per call.
+    '''
+    year, month, day, hour, minute, second = short_time_tuple
+    days_since_jan1 = (31, 28 + (year % 4 == 0), 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+    day_of_year = sum(days_since_jan1[:month - 1]) + day
+    days_since_1900 = (year - 1900) * 365 + (year - 1901) // 4 + day_of_year - 1
+    days_since_1970 = days_since_1900 - 25568
+    day_of_week = (days_since_1970 + 4) % 7
+    return year, month, day, hour, minute, second, day_of_week, day_of_year, -1
+
+
+##=============================================================================
+def cettime_mktime(ts_utc):
+    '''
+    datetime_util.cettime() before tz_util, finding the changes of the year
+    with time.mktime() on every call.
+    '''
+    year = time.localtime(ts_utc)[0]
+    march = time.mktime((year, 3, (31 - (int(5 * year / 4 + 4)) % 7), 1, 0, 0, 0, 0, 0))
+    october = time.mktime((year, 10, (31 - (int(5 * year / 4 + 1)) % 7), 1, 0, 0, 0, 0, 0))
+    offset = 7200 if march <= ts_utc < october else 3600
+    return time.localtime(ts_utc + offset)
+
+
+##=============================================================================
+def agree(results, ref_results):
+    '''
+    Compare time tuples up to the day of the year.
+    '''
+    return all(a[:8] == tuple(b[:8]) for a, b in zip(results, ref_results))
+
+
+##=============================================================================
+def timed(func, args):
+    '''
+    Call a function for each argument.
+
+    Returns
+    -------
+    results : list
+    ns : float
+        Mean time per call.
+    '''
+    t0 = time.perf_counter_ns()
+    results = [func(arg) for arg in args]
+    return results, (time.perf_counter_ns() - t0) / len(args)
+
+
+##=============================================================================
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark of the calendar conversions of datetime_util.")
+    parser.add_argument('--count', type=int, default=100000, help="number of timestamps (default: 100000)")
+    parser.add_argument('--epoch', type=int, default=1970, choices=sorted(EPOCH_DAYS), help="epoch year (default: 1970)")
+    parser.add_argument('--seed', type=int, default=0, help="seed of the timestamps (default: 0)")
+    args = parser.parse_args()
+
+    os.environ['TZ'] = 'UTC'
+    time.tzset()
+
+    epoch_days = EPOCH_DAYS[args.epoch]
+    shift = epoch_days * datetime_util.DAY
+    rng = random.Random(args.seed)
+    ## 2000-01-01 .. 2099-12-31, the range of both epochs on the ESP32
+    timestamps = [rng.randrange(946684800, 4102444800) - shift for _ in range(args.count)]
+
+    def timetuple(ts):
+        return datetime_util.timetuple(ts, epoch_days)
+
+    def timestamp(time_tuple):
+        return datetime_util.timestamp(time_tuple, epoch_days)
+
+    def gmtime(ts):
+        return time.gmtime(ts + shift)
+
+    def mktime(time_tuple):
+        return int(time.mktime(time_tuple)) - shift
+
+    tuples, int_ns = timed(timetuple, timestamps)
+    ref_tuples, ref_ns = timed(gmtime, timestamps)
+    results = [('timetuple', int_ns, 'time.gmtime', ref_ns, agree(tuples, ref_tuples))]
+
+    seconds, int_ns = timed(timestamp, tuples)
+    ref_seconds, ref_ns = timed(mktime, tuples)
+    results.append(('timestamp', int_ns, 'time.mktime', ref_ns,
+                    seconds == ref_seconds == timestamps))
+
+    short_tuples = [t[:6] for t in tuples]
+    full, int_ns = timed(datetime_util.get_timetuple, short_tuples)
+    ref_full, ref_ns = timed(get_timetuple_table, short_tuples)
+    ## the month table treats 2100 as leap year, so compare 2000..2099 only
+    results.append(('get_timetuple', int_ns, 'month table', ref_ns, full == ref_full == tuples))
+
+    host_timestamps = [ts + shift for ts in timestamps]
+    local, int_ns = timed(datetime_util.cettime, host_timestamps)
+    ref_local, ref_ns = timed(cettime_mktime, host_timestamps)
+    results.append(('cettime', int_ns, 'mktime', ref_ns, agree(local, ref_local)))
+    ticking = range(host_timestamps[0], host_timestamps[0] + args.count)
+    local, int_ns = timed(datetime_util.cettime, ticking)
+    ref_local, ref_ns = timed(cettime_mktime, ticking)
+    results.append(('cettime ticking', int_ns, 'mktime', ref_ns, agree(local, ref_local)))
+
+    print("{} timestamps, epoch {}".format(args.count, args.epoch))
+    print("{:<16} {:>10} {:<14} {:>10} {:>8}".format('function', 'ns/call', 'reference', 'ns/call', 'agree'))
+    failed = False
+    for name, int_ns, ref_name, ref_ns, agrees in results:
+        print("{:<16} {:>10.0f} {:<14} {:>10.0f} {:>8}".format(name, int_ns, ref_name, ref_ns, 'yes' if agrees else 'NO'))
+        failed |= not agrees
+    sys.exit(1 if failed else 0)
+
+
+##*****************************************************************************
+##*****************************************************************************
+if __name__ == '__main__':
+    main()
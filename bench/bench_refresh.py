@@ -0,0 +1,178 @@
+# -*- coding: utf-8 -*-
+
+"""
+Benchmark of the display refresh strategies against the simulated panel.
+
+Runs the clock face renderer together with the display refresh, like
+main.py does, and reports the refresh rate, the frame gaps and the jitter
+measured by profile_util.FrameProfiler for these strategies:
+
+    asyncio : refresh as cooperative task, main.refresh_mode = 'asyncio'
+    thread  : refresh in its own thread, main.refresh_mode = 'thread'
+
+This is the comparison the flicker demos main_HUB75_flicker_asyncio.py and
+main_HUB75_flicker_thread.py make by eye. A blocking task stands in for the
+blocking NTP sync. Run with CPython from the repository root:
+
+    python bench/bench_refresh.py [--duration 5] [--block-ms 50]
+
+With --max-gap-ms, the exit code is 1 if a strategy exceeds the worst gap.
+
+@author: mada
+@version: 2026-10-17
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import threading
+import time
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path[:0] = [os.path.join(ROOT, 'sim'), os.path.join(ROOT, 'src')]
+
+import hub75  # noqa: E402 (simulated)
+import matrixdata  # noqa: E402 (simulated)
+import clockface  # noqa: E402
+import font_util  # noqa: E402
+import framebuffer  # noqa: E402
+import profile_util  # noqa: E402
+
+##*****************************************************************************
+##*****************************************************************************
+
+ROW_SIZE = 32
+COL_SIZE = 64
+
+
+##=============================================================================
+class ScanTime():
+    '''
+    Simulated panel that takes `scan_us` of CPU time per frame, like the
+    bit-shifting of the real driver.
+    '''
+    def __init__(self, hub75spi, scan_us):
+        self.hub75spi = hub75spi
+        self.scan_us = scan_us
+
+    @property
+    def matrix_data(self):
+        return self.hub75spi.matrix_data
+
+    @matrix_data.setter
+    def matrix_data(self, matrix_data):
+        ## set by DoubleBuffer.swap()
+        self.hub75spi.matrix_data = matrix_data
+
+    def display_data(self):
+        t_end = time.perf_counter() + self.scan_us / 1000000
+        while time.perf_counter() < t_end:
+            pass
+        self.hub75spi.display_data()
+
+
+##=============================================================================
+class Bench():
+    '''
+    Clock face rendering, a blocking task and the display refresh of one
+    strategy, running for `args.duration` seconds.
+    '''
+    def __init__(self, mode, fonts, args):
+        self.mode = mode
+        self.args = args
+        front = matrixdata.MatrixData(ROW_SIZE, COL_SIZE)
+        back = matrixdata.MatrixData(ROW_SIZE, COL_SIZE)
+        hub75spi = hub75.Hub75Spi(front, hub75.Hub75SpiConfiguration())
+        self.frames = framebuffer.DoubleBuffer(ScanTime(hub75spi, args.scan_us), front, back)
+        self.display = profile_util.FrameProfiler(self.frames, args.size)
+        self.face = clockface.ClockFace(fonts, seconds=True)
+        self.running = True
+
+    async def render(self):
+        n = 0
+        while self.running:
+            await self.frames.wait_free()
+            self.face.render(self.frames.back, 12, n // 60 % 60, n % 60, 21.5, 45.0)
+            self.frames.publish()
+            n += 1
+            await asyncio.sleep(self.args.update)
+
+    async def block(self):
+        while self.running:
+            await asyncio.sleep(self.args.block_period)
+            ## e.g. the blocking NTP sync
+            time.sleep(self.args.block_ms / 1000)
+
+    async def refresh(self):
+        while self.running:
+            self.display.display_data()
+            await asyncio.sleep(0)
+
+    def refresh_thread(self):
+        while self.running:
+            self.display.display_data()
+
+    async def main(self):
+        tasks = [asyncio.create_task(self.render()), asyncio.create_task(self.block())]
+        if self.mode == 'thread':
+            thread = threading.Thread(target=self.refresh_thread)
+            thread.start()
+        else:
+            tasks.append(asyncio.create_task(self.refresh()))
+        await asyncio.sleep(self.args.duration)
+        self.running = False
+        if self.mode == 'thread':
+            thread.join()
+        for task in tasks:
+            task.cancel()
+
+
+##=============================================================================
+def run(mode, fonts, args):
+    '''
+    Benchmark one strategy.
+
+    Returns
+    -------
+    stats : dict
+        See profile_util.FrameProfiler.stats().
+    '''
+    bench = Bench(mode, fonts, args)
+    asyncio.run(bench.main())
+    return bench.display.stats()
+
+
+##=============================================================================
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark of the display refresh strategies.")
+    parser.add_argument('--duration', type=float, default=5, help="seconds per strategy (default: 5)")
+    parser.add_argument('--update', type=float, default=0.1, help="seconds between clock face updates (default: 0.1)")
+    parser.add_argument('--scan-us', type=int, default=500, help="simulated scan time per frame in us (default: 500)")
+    parser.add_argument('--block-ms', type=float, default=50, help="duration of the blocking task in ms (default: 50)")
+    parser.add_argument('--block-period', type=float, default=1, help="seconds between blocking calls (default: 1)")
+    parser.add_argument('--size', type=int, default=65536, help="number of frames kept by the profiler (default: 65536)")
+    parser.add_argument('--max-gap-ms', type=float, help="fail if the worst gap exceeds this limit")
+    args = parser.parse_args()
+
+    fonts = font_util.load(os.path.join(ROOT, 'src', 'characters.bin'))
+
+    print("{} s per strategy, {} us scan time, {} ms blocking every {} s".format(
+        args.duration, args.scan_us, args.block_ms, args.block_period))
+    print("{:<10} {:>8} {:>10} {:>10} {:>10} {:>10} {:>12}".format(
+        'strategy', 'frames', 'rate [Hz]', 'p50 [us]', 'p99 [us]', 'max [us]', 'jitter [us]'))
+    failed = False
+    for mode in ('asyncio', 'thread'):
+        stats = run(mode, fonts, args)
+        print("{:<10} {frames:>8} {rate_hz:>10.1f} {gap_p50_us:>10} {gap_p99_us:>10} {gap_max_us:>10} {jitter_us:>12}".format(
+            mode, **stats))
+        if args.max_gap_ms is not None and stats['gap_max_us'] > args.max_gap_ms * 1000:
+            print("!! {}: worst gap exceeds {} ms".format(mode, args.max_gap_ms))
+            failed = True
+    sys.exit(1 if failed else 0)
+
+
+##*****************************************************************************
+##*****************************************************************************
+if __name__ == '__main__':
+    main()
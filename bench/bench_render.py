@@ -0,0 +1,177 @@
+# -*- coding: utf-8 -*-
+
+"""
+Benchmark of the clock face rendering against the simulated matrix.
+
+Renders the clock face for a series of timestamps and sensor readings and
+reports per frame the render time (mean and p99), the allocated memory and
+the pixels written, for these strategies:
+
+    clear_all_bytes   : clear the whole matrix, draw all glyphs
+    clear_dirty_bytes : clear the recorded dirty pixels, draw all glyphs
+    incremental       : clockface.ClockFace, redraw changed glyph cells only
+
+The first two are the strategies main_HUB75_flicker_asyncio.setpixel1()
+toggles between. Run with CPython from the repository root:
+
+    python bench/bench_render.py [--frames 8640] [--step 10]
+
+For the HH:MM.SS face updated at 1 Hz:
+
+    python bench/bench_render.py --seconds --step 1
+
+@author: mada
+@version: 2026-10-17
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path[:0] = [os.path.join(ROOT, 'sim'), os.path.join(ROOT, 'src')]
+
+import matrixdata  # noqa: E402 (simulated)
+import clockface  # noqa: E402
+import datetime_util  # noqa: E402
+import font_util  # noqa: E402
+
+##*****************************************************************************
+##*****************************************************************************
+
+ROW_SIZE = 32
+COL_SIZE = 64
+
+
+##=============================================================================
+def readings(frames, step, seed):
+    '''
+    Generate the clock readings, starting on 2023-12-09 00:00:00 UTC.
+
+    The temperature and humidity follow a random walk and drop out now and
+    then, to cover all sensor string layouts.
+
+    Returns
+    -------
+    readings : list
+        Tuples (hour, minute, second, temp, hum).
+    '''
+    rng = random.Random(seed)
+    ts = 1702080000
+    temp, hum = 21.0, 45.0
+    result = []
+    for _ in range(frames):
+        hour, minute, second = datetime_util.cettime(ts)[3:6]
+        temp = min(max(temp + rng.uniform(-0.3, 0.3), -15.0), 35.0)
+        hum = min(max(hum + rng.uniform(-0.5, 0.5), 0.0), 99.9)
+        if rng.random() < 0.01:
+            result.append((hour, minute, second, None, None))
+        else:
+            result.append((hour, minute, second, temp, hum))
+        ts += step
+    return result
+
+
+##=============================================================================
+def full_redraw(clear, seconds):
+    '''
+    Create a renderer that clears the matrix and draws all glyphs, like
+    set_clock() did before the incremental clock face.
+    '''
+    def render(matrix, fonts, hour, minute, second, temp, hum):
+        time_str, sensor_str = clockface.format_readings(hour, minute, second, temp, hum)
+        time_runs = ((time_str[:-3], fonts['big'], clockface.ClockFace.space_big),)
+        if seconds:
+            time_runs += ((time_str[-3:], fonts['small'], clockface.ClockFace.space_small),)
+        sensor_runs = ((sensor_str, fonts['small'], clockface.ClockFace.space_small),)
+        getattr(matrix, clear)()
+        font_util.draw(matrix, 5, font_util.align(time_runs), time_runs, font_util.YELLOW)
+        font_util.draw(matrix, 22, font_util.align(sensor_runs), sensor_runs, font_util.YELLOW)
+    return render
+
+
+##=============================================================================
+def incremental(fonts, seconds):
+    '''
+    Create a renderer using clockface.ClockFace.
+    '''
+    face = clockface.ClockFace(fonts, seconds=seconds)
+
+    def render(matrix, fonts, hour, minute, second, temp, hum):
+        face.render(matrix, hour, minute, second, temp, hum, font_util.YELLOW)
+    return render
+
+
+##=============================================================================
+def run(name, render, fonts, record_dirty_bytes, data):
+    '''
+    Benchmark one strategy.
+
+    Returns
+    -------
+    result : dict
+    '''
+    ## timing run
+    matrix = matrixdata.MatrixData(ROW_SIZE, COL_SIZE)
+    matrix.record_dirty_bytes = record_dirty_bytes
+    durations = []
+    for reading in data:
+        t0 = time.perf_counter_ns()
+        render(matrix, fonts, *reading)
+        durations.append(time.perf_counter_ns() - t0)
+    pixel_writes = matrix.pixel_writes
+
+    ## allocation run, separately since tracing slows down the rendering
+    matrix = matrixdata.MatrixData(ROW_SIZE, COL_SIZE)
+    matrix.record_dirty_bytes = record_dirty_bytes
+    allocated = 0
+    tracemalloc.start()
+    for reading in data:
+        before = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        render(matrix, fonts, *reading)
+        allocated += tracemalloc.get_traced_memory()[1] - before
+    tracemalloc.stop()
+
+    durations.sort()
+    frames = len(data)
+    return {
+        'name': name,
+        'mean_us': sum(durations) / frames / 1000,
+        'p99_us': durations[min(frames - 1, int(frames * 0.99))] / 1000,
+        'alloc_bytes': allocated / frames,
+        'pixels': pixel_writes / frames,
+        }
+
+
+##=============================================================================
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark of the clock face rendering.")
+    parser.add_argument('--frames', type=int, default=8640, help="number of rendered frames (default: 8640)")
+    parser.add_argument('--step', type=int, default=10, help="seconds between frames (default: 10)")
+    parser.add_argument('--seed', type=int, default=0, help="seed of the sensor random walk (default: 0)")
+    parser.add_argument('--seconds', action='store_true', help="render HH:MM.SS instead of HH:MM")
+    args = parser.parse_args()
+
+    fonts = font_util.load(os.path.join(ROOT, 'src', 'characters.bin'))
+    data = readings(args.frames, args.step, args.seed)
+
+    results = (
+        run('clear_all_bytes', full_redraw('clear_all_bytes', args.seconds), fonts, False, data),
+        run('clear_dirty_bytes', full_redraw('clear_dirty_bytes', args.seconds), fonts, True, data),
+        run('incremental', incremental(fonts, args.seconds), fonts, False, data),
+        )
+
+    print("{} frames of {}, {} s apart".format(args.frames, 'HH:MM.SS' if args.seconds else 'HH:MM', args.step))
+    print("{:<18} {:>10} {:>10} {:>14} {:>14}".format('strategy', 'mean [us]', 'p99 [us]', 'alloc [B/fr]', 'pixels [1/fr]'))
+    for result in results:
+        print("{name:<18} {mean_us:>10.1f} {p99_us:>10.1f} {alloc_bytes:>14.0f} {pixels:>14.1f}".format(**result))
+
+
+##*****************************************************************************
+##*****************************************************************************
+if __name__ == '__main__':
+    main()
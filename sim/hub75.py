@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+
+"""
+Simulated hub75 module for running the rendering on a workstation.
+
+Drop-in for hub75.Hub75Spi of Hub75MicroPython with CPython, put the sim/
+directory in front of src/ on the module path:
+
+    import sys
+    sys.path[:0] = ['sim', 'src']
+
+display_data() takes a snapshot of the scanned matrix instead of driving the
+panel, so frames can be counted, compared and dumped at full speed.
+
+@author: mada
+@version: 2026-10-17
+"""
+
+##*****************************************************************************
+##*****************************************************************************
+
+## 3-bit RGB color -> 8-bit RGB triple
+RGB = tuple(bytes((255 * (color >> 2 & 1), 255 * (color >> 1 & 1), 255 * (color & 1))) for color in range(8))
+
+
+##=============================================================================
+class Hub75SpiConfiguration():
+    '''
+    Pin and timing configuration, accepted and ignored by the simulation.
+    '''
+    def __init__(self):
+        self.illumination_time_microseconds = 10
+        self.line_select_a_pin_number = 0
+        self.line_select_b_pin_number = 0
+        self.line_select_c_pin_number = 0
+        self.line_select_d_pin_number = 0
+        self.line_select_e_pin_number = 0
+        self.red1_pin_number = 0
+        self.green1_pin_number = 0
+        self.blue1_pin_number = 0
+        self.red2_pin_number = 0
+        self.green2_pin_number = 0
+        self.blue2_pin_number = 0
+        self.clock_pin_number = 0
+        self.latch_pin_number = 0
+        self.output_enable_pin_number = 0
+        self.spi_miso_pin_number = 0
+
+
+##=============================================================================
+class Hub75Spi():
+    '''
+    Simulated panel driver.
+
+    Attributes
+    ----------
+    frames : int
+        Number of frames scanned out.
+    frame : bytes
+        Pixels of the last frame, one 3-bit RGB color per byte.
+    '''
+    def __init__(self, matrix_data, config):
+        self.matrix_data = matrix_data
+        self.config = config
+        self.frames = 0
+        self.frame = bytes(matrix_data.row_size * matrix_data.col_size)
+
+    def display_data(self):
+        self.frame = bytes(self.matrix_data.pixels)
+        self.frames += 1
+
+    def to_array(self):
+        '''
+        Return the last frame as a list of pixel rows of 3-bit RGB colors.
+        '''
+        col_size = self.matrix_data.col_size
+        return [list(self.frame[i:i + col_size]) for i in range(0, len(self.frame), col_size)]
+
+    def to_ppm(self, scale=8):
+        '''
+        Return the last frame as binary PPM image, each pixel a square of
+        `scale` x `scale` image pixels.
+
+        Returns
+        -------
+        image : bytes
+        '''
+        col_size = self.matrix_data.col_size
+        row_size = len(self.frame) // col_size
+        header = "P6\n{} {}\n255\n".format(col_size * scale, row_size * scale).encode('ascii')
+        rows = []
+        for i in range(0, len(self.frame), col_size):
+            row = b''.join(RGB[color] * scale for color in self.frame[i:i + col_size])
+            rows.append(row * scale)
+        return header + b''.join(rows)
+
+    def write_ppm(self, path, scale=8):
+        with open(path, 'wb') as f:
+            f.write(self.to_ppm(scale))
@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+
+"""
+Simulated matrixdata module for running the rendering on a workstation.
+
+Drop-in for matrixdata.MatrixData of Hub75MicroPython with CPython, put the
+sim/ directory in front of src/ on the module path. Pixels are kept as one
+3-bit RGB color per byte.
+
+@author: mada
+@version: 2026-10-17
+"""
+
+##*****************************************************************************
+##*****************************************************************************
+
+
+##=============================================================================
+class MatrixData():
+    '''
+    Pixel buffer with the drawing interface of matrixdata.MatrixData.
+
+    Additionally counts the pixel writes in `pixel_writes`. Pixels outside
+    the matrix raise IndexError, so layouts overflowing the panel show up in
+    the benchmarks and checks.
+    '''
+    def __init__(self, row_size, col_size):
+        self.row_size = row_size
+        self.col_size = col_size
+        self.pixels = bytearray(row_size * col_size)
+        self.record_dirty_bytes = False
+        self.dirty_pixels = set()
+        self.pixel_writes = 0
+
+    def _index(self, row, col):
+        if not (0 <= row < self.row_size and 0 <= col < self.col_size):
+            raise IndexError("pixel ({}, {}) outside the {}x{} matrix".format(row, col, self.row_size, self.col_size))
+        return row * self.col_size + col
+
+    def set_pixel_value(self, row, col, value):
+        index = self._index(row, col)
+        self.pixels[index] = value & 0b111
+        self.pixel_writes += 1
+        if self.record_dirty_bytes:
+            self.dirty_pixels.add(index)
+
+    def set_pixels(self, row, col, data):
+        for r, values in enumerate(data):
+            for c, value in enumerate(values):
+                self.set_pixel_value(row + r, col + c, value)
+
+    def get_pixel_value(self, row, col):
+        return self.pixels[self._index(row, col)]
+
+    def clear_dirty_bytes(self):
+        for index in self.dirty_pixels:
+            self.pixels[index] = 0
+        self.pixel_writes += len(self.dirty_pixels)
+        self.dirty_pixels.clear()
+
+    def clear_all_bytes(self):
+        self.pixels[:] = bytes(len(self.pixels))
+        self.pixel_writes += len(self.pixels)
+        self.dirty_pixels.clear()
@@ -1,528 +1,543 @@
-# noqa: E231
-
-big0 = [
-    [0,1,1,1,1,1,1,0],
-    [1,1,1,1,1,1,1,1],
-    [1,1,0,0,0,0,1,1],
-    [1,1,0,0,0,0,1,1],
-    [1,1,0,0,0,0,1,1],
-    [1,1,0,0,0,0,1,1],
-    [1,1,0,0,0,0,1,1],
-    [1,1,0,0,0,0,1,1],
-    [1,1,0,0,0,0,1,1],
-    [1,1,0,0,0,0,1,1],
-    [1,1,0,0,0,0,1,1],
-    [1,1,0,0,0,0,1,1],
-    [1,1,1,1,1,1,1,1],
-    [0,1,1,1,1,1,1,0],
-    ]
-
-big1 = [
-    [0,0,0,1,1,0,0,0],
-    [0,0,1,1,1,0,0,0],
-    [0,1,1,1,1,0,0,0],
-    [0,0,0,1,1,0,0,0],
-    [0,0,0,1,1,0,0,0],
-    [0,0,0,1,1,0,0,0],
-    [0,0,0,1,1,0,0,0],
-    [0,0,0,1,1,0,0,0],
-    [0,0,0,1,1,0,0,0],
-    [0,0,0,1,1,0,0,0],
-    [0,0,0,1,1,0,0,0],
-    [0,0,0,1,1,0,0,0],
-    [1,1,1,1,1,1,1,1],
-    [1,1,1,1,1,1,1,1],
-    ]
-
-big2 = [
-    [0,1,1,1,1,1,1,0],
-    [1,1,1,1,1,1,1,1],
-    [1,1,0,0,0,0,1,1],
-    [0,0,0,0,0,0,1,1],
-    [0,0,0,0,0,0,1,1],
-    [0,0,0,0,0,0,1,1],
-    [0,0,0,0,0,1,1,0],
-    [0,0,0,0,1,1,0,0],
-    [0,0,0,1,1,0,0,0],
-    [0,0,1,1,0,0,0,0],
-    [0,1,1,0,0,0,0,0],
-    [1,1,0,0,0,0,0,0],
-    [1,1,1,1,1,1,1,1],
-    [1,1,1,1,1,1,1,1],
-    ]
-
-big3 = [
-    [0,1,1,1,1,1,1,0],
-    [1,1,1,1,1,1,1,1],
-    [1,1,0,0,0,0,1,1],
-    [0,0,0,0,0,0,1,1],
-    [0,0,0,0,0,0,1,1],
-    [0,0,0,0,0,0,1,1],
-    [0,0,0,0,1,1,1,0],
-    [0,0,0,0,1,1,1,0],
-    [0,0,0,0,0,0,1,1],
-    [0,0,0,0,0,0,1,1],
-    [0,0,0,0,0,0,1,1],
-    [1,1,0,0,0,0,1,1],
-    [1,1,1,1,1,1,1,1],
-    [0,1,1,1,1,1,1,0],
-    ]
-
-big4 = [
-    [1,1,0,0,0,0,0,0],
-    [1,1,0,0,0,0,0,0],
-    [1,1,0,0,0,0,0,0],
-    [1,1,0,0,0,0,0,0],
-    [1,1,0,0,0,0,0,0],
-    [1,1,0,0,0,0,0,0],
-    [1,1,0,0,1,1,0,0],
-    [1,1,0,0,1,1,0,0],
-    [1,1,1,1,1,1,1,1],
-    [1,1,1,1,1,1,1,1],
-    [0,0,0,0,1,1,0,0],
-    [0,0,0,0,1,1,0,0],
-    [0,0,0,0,1,1,0,0],
-    [0,0,0,0,1,1,0,0],
-    ]
-
-big5 = [
-    [1,1,1,1,1,1,1,1],
-    [1,1,1,1,1,1,1,1],
-    [1,1,0,0,0,0,0,0],
-    [1,1,0,0,0,0,0,0],
-    [1,1,0,0,0,0,0,0],
-    [1,1,1,1,1,1,1,0],
-    [1,1,1,1,1,1,1,1],
-    [0,0,0,0,0,0,1,1],
-    [0,0,0,0,0,0,1,1],
-    [0,0,0,0,0,0,1,1],
-    [0,0,0,0,0,0,1,1],
-    [1,1,0,0,0,0,1,1],
-    [1,1,1,1,1,1,1,1],
-    [0,1,1,1,1,1,1,0],
-    ]
-
-big6 = [
-    [0,1,1,1,1,1,1,0],
-    [1,1,1,1,1,1,1,1],
-    [1,1,0,0,0,0,1,1],
-    [1,1,0,0,0,0,0,0],
-    [1,1,0,0,0,0,0,0],
-    [1,1,0,0,0,0,0,0],
-    [1,1,1,1,1,1,1,0],
-    [1,1,1,1,1,1,1,1],
-    [1,1,0,0,0,0,1,1],
-    [1,1,0,0,0,0,1,1],
-    [1,1,0,0,0,0,1,1],
-    [1,1,0,0,0,0,1,1],
-    [1,1,1,1,1,1,1,1],
-    [0,1,1,1,1,1,1,0],
-    ]
-
-big7 = [
-    [1,1,1,1,1,1,1,1],
-    [1,1,1,1,1,1,1,1],
-    [0,0,0,0,0,0,1,1],
-    [0,0,0,0,0,0,1,1],
-    [0,0,0,0,0,0,1,1],
-    [0,0,0,0,0,0,1,1],
-    [0,0,0,0,0,1,1,0],
-    [0,0,0,0,1,1,0,0],
-    [0,0,0,1,1,0,0,0],
-    [0,0,0,1,1,0,0,0],
-    [0,0,0,1,1,0,0,0],
-    [0,0,0,1,1,0,0,0],
-    [0,0,0,1,1,0,0,0],
-    [0,0,0,1,1,0,0,0],
-    ]
-
-big8 = [
-    [0,1,1,1,1,1,1,0],
-    [1,1,1,1,1,1,1,1],
-    [1,1,0,0,0,0,1,1],
-    [1,1,0,0,0,0,1,1],
-    [1,1,0,0,0,0,1,1],
-    [1,1,0,0,0,0,1,1],
-    [0,1,1,1,1,1,1,0],
-    [0,1,1,1,1,1,1,0],
-    [1,1,0,0,0,0,1,1],
-    [1,1,0,0,0,0,1,1],
-    [1,1,0,0,0,0,1,1],
-    [1,1,0,0,0,0,1,1],
-    [1,1,1,1,1,1,1,1],
-    [0,1,1,1,1,1,1,0],
-    ]
-
-big9 = [
-    [0,1,1,1,1,1,1,0],
-    [1,1,1,1,1,1,1,1],
-    [1,1,0,0,0,0,1,1],
-    [1,1,0,0,0,0,1,1],
-    [1,1,0,0,0,0,1,1],
-    [1,1,0,0,0,0,1,1],
-    [1,1,1,1,1,1,1,1],
-    [0,1,1,1,1,1,1,1],
-    [0,0,0,0,0,0,1,1],
-    [0,0,0,0,0,0,1,1],
-    [0,0,0,0,0,0,1,1],
-    [1,1,0,0,0,0,1,1],
-    [1,1,1,1,1,1,1,1],
-    [0,1,1,1,1,1,1,0],
-    ]
-
-# big_dot = [
-#     [0,0,0,0,0,0,0,0],
-#     [0,0,0,0,0,0,0,0],
-#     [0,0,0,0,0,0,0,0],
-#     [0,0,0,0,0,0,0,0],
-#     [0,0,0,0,0,0,0,0],
-#     [0,0,0,0,0,0,0,0],
-#     [0,0,0,0,0,0,0,0],
-#     [0,0,0,0,0,0,0,0],
-#     [0,0,0,0,0,0,0,0],
-#     [0,0,0,0,0,0,0,0],
-#     [0,0,0,0,0,0,0,0],
-#     [0,0,0,0,0,0,0,0],
-#     [0,0,0,1,1,0,0,0],
-#     [0,0,0,1,1,0,0,0],
-#     ]
-
-# big_colon = [
-#     [0,0,0,0,0,0,0,0],
-#     [0,0,0,0,0,0,0,0],
-#     [0,0,0,0,0,0,0,0],
-#     [0,0,0,0,0,0,0,0],
-#     [0,0,0,1,1,0,0,0],
-#     [0,0,0,1,1,0,0,0],
-#     [0,0,0,0,0,0,0,0],
-#     [0,0,0,0,0,0,0,0],
-#     [0,0,0,1,1,0,0,0],
-#     [0,0,0,1,1,0,0,0],
-#     [0,0,0,0,0,0,0,0],
-#     [0,0,0,0,0,0,0,0],
-#     [0,0,0,0,0,0,0,0],
-#     [0,0,0,0,0,0,0,0],
-#     ]
-
-big_dot = [
-    [0,0],
-    [0,0],
-    [0,0],
-    [0,0],
-    [0,0],
-    [0,0],
-    [0,0],
-    [0,0],
-    [0,0],
-    [0,0],
-    [0,0],
-    [0,0],
-    [1,1],
-    [1,1],
-    ]
-
-big_colon = [
-    [0,0],
-    [0,0],
-    [0,0],
-    [0,0],
-    [1,1],
-    [1,1],
-    [0,0],
-    [0,0],
-    [1,1],
-    [1,1],
-    [0,0],
-    [0,0],
-    [0,0],
-    [0,0],
-    ]
-
-big_degree = [
-    [0,1,1,0],
-    [1,0,0,1],
-    [1,0,0,1],
-    [0,1,1,0],
-    [0,0,0,0],
-    [0,0,0,0],
-    [0,0,0,0],
-    [0,0,0,0],
-    [0,0,0,0],
-    [0,0,0,0],
-    [0,0,0,0],
-    [0,0,0,0],
-    [0,0,0,0],
-    [0,0,0,0],
-    ]
-
-big_degreeC = [
-    [0,1,1,0,1,1,1,1],
-    [1,0,0,1,1,0,0,0],
-    [1,0,0,1,1,0,0,0],
-    [0,1,1,0,1,0,0,0],
-    [0,0,0,0,1,0,0,0],
-    [0,0,0,0,1,1,1,1],
-    [0,0,0,0,0,0,0,0],
-    [0,0,0,0,0,0,0,0],
-    [0,0,0,0,0,0,0,0],
-    [0,0,0,0,0,0,0,0],
-    [0,0,0,0,0,0,0,0],
-    [0,0,0,0,0,0,0,0],
-    [0,0,0,0,0,0,0,0],
-    [0,0,0,0,0,0,0,0],
-    ]
-
-big_percent = [
-    [0,0,0,0,0,0,0,0],
-    [0,0,0,0,0,0,0,0],
-    [1,1,1,1,0,0,0,0],
-    [0,1,1,0,0,0,0,0],
-    [1,0,0,1,0,0,1,1],
-    [1,0,0,1,0,1,1,0],
-    [0,1,1,0,1,1,0,0],
-    [0,0,0,1,1,0,0,0],
-    [0,0,1,1,0,1,1,0],
-    [0,1,1,0,1,0,0,1],
-    [1,1,0,0,1,0,0,1],
-    [0,0,0,0,0,1,1,0],
-    [0,0,0,0,0,0,0,0],
-    [0,0,0,0,0,0,0,0],
-    ]
-
-big_dash = [
-    [0,0,0,0,0,0,0,0],
-    [0,0,0,0,0,0,0,0],
-    [0,0,0,0,0,0,0,0],
-    [0,0,0,0,0,0,0,0],
-    [0,0,0,0,0,0,0,0],
-    [0,0,0,0,0,0,0,0],
-    [0,1,1,1,1,1,1,0],
-    [0,1,1,1,1,1,1,0],
-    [0,0,0,0,0,0,0,0],
-    [0,0,0,0,0,0,0,0],
-    [0,0,0,0,0,0,0,0],
-    [0,0,0,0,0,0,0,0],
-    [0,0,0,0,0,0,0,0],
-    [0,0,0,0,0,0,0,0],
-    ]
-
-big_space = [
-    [0,0,0,0,0,0,0,0],
-    [0,0,0,0,0,0,0,0],
-    [0,0,0,0,0,0,0,0],
-    [0,0,0,0,0,0,0,0],
-    [0,0,0,0,0,0,0,0],
-    [0,0,0,0,0,0,0,0],
-    [0,0,0,0,0,0,0,0],
-    [0,0,0,0,0,0,0,0],
-    [0,0,0,0,0,0,0,0],
-    [0,0,0,0,0,0,0,0],
-    [0,0,0,0,0,0,0,0],
-    [0,0,0,0,0,0,0,0],
-    [0,0,0,0,0,0,0,0],
-    [0,0,0,0,0,0,0,0],
-    ]
+# -*- coding: utf-8 -*-
+
+"""
+Dot matrix characters for the clock face.
+
+Each glyph is a tuple (width, height, rows) with one bitmask per pixel row
+packed into a bytes object. The leftmost pixel is the most significant of the
+`width` bits, i.e. the binary literals below read like the pixel rows.
+Glyphs carry no color, see font_util.blit().
+
+This module is the source for tools/font_compiler.py and is not needed on the
+device, which reads the compiled characters.bin instead.
+
+@author: mada
+@version: 2026-10-17
+"""
+
+big0 = (8, 14, bytes((
+    0b01111110,
+    0b11111111,
+    0b11000011,
+    0b11000011,
+    0b11000011,
+    0b11000011,
+    0b11000011,
+    0b11000011,
+    0b11000011,
+    0b11000011,
+    0b11000011,
+    0b11000011,
+    0b11111111,
+    0b01111110,
+    )))
+
+big1 = (8, 14, bytes((
+    0b00011000,
+    0b00111000,
+    0b01111000,
+    0b00011000,
+    0b00011000,
+    0b00011000,
+    0b00011000,
+    0b00011000,
+    0b00011000,
+    0b00011000,
+    0b00011000,
+    0b00011000,
+    0b11111111,
+    0b11111111,
+    )))
+
+big2 = (8, 14, bytes((
+    0b01111110,
+    0b11111111,
+    0b11000011,
+    0b00000011,
+    0b00000011,
+    0b00000011,
+    0b00000110,
+    0b00001100,
+    0b00011000,
+    0b00110000,
+    0b01100000,
+    0b11000000,
+    0b11111111,
+    0b11111111,
+    )))
+
+big3 = (8, 14, bytes((
+    0b01111110,
+    0b11111111,
+    0b11000011,
+    0b00000011,
+    0b00000011,
+    0b00000011,
+    0b00001110,
+    0b00001110,
+    0b00000011,
+    0b00000011,
+    0b00000011,
+    0b11000011,
+    0b11111111,
+    0b01111110,
+    )))
+
+big4 = (8, 14, bytes((
+    0b11000000,
+    0b11000000,
+    0b11000000,
+    0b11000000,
+    0b11000000,
+    0b11000000,
+    0b11001100,
+    0b11001100,
+    0b11111111,
+    0b11111111,
+    0b00001100,
+    0b00001100,
+    0b00001100,
+    0b00001100,
+    )))
+
+big5 = (8, 14, bytes((
+    0b11111111,
+    0b11111111,
+    0b11000000,
+    0b11000000,
+    0b11000000,
+    0b11111110,
+    0b11111111,
+    0b00000011,
+    0b00000011,
+    0b00000011,
+    0b00000011,
+    0b11000011,
+    0b11111111,
+    0b01111110,
+    )))
+
+big6 = (8, 14, bytes((
+    0b01111110,
+    0b11111111,
+    0b11000011,
+    0b11000000,
+    0b11000000,
+    0b11000000,
+    0b11111110,
+    0b11111111,
+    0b11000011,
+    0b11000011,
+    0b11000011,
+    0b11000011,
+    0b11111111,
+    0b01111110,
+    )))
+
+big7 = (8, 14, bytes((
+    0b11111111,
+    0b11111111,
+    0b00000011,
+    0b00000011,
+    0b00000011,
+    0b00000011,
+    0b00000110,
+    0b00001100,
+    0b00011000,
+    0b00011000,
+    0b00011000,
+    0b00011000,
+    0b00011000,
+    0b00011000,
+    )))
+
+big8 = (8, 14, bytes((
+    0b01111110,
+    0b11111111,
+    0b11000011,
+    0b11000011,
+    0b11000011,
+    0b11000011,
+    0b01111110,
+    0b01111110,
+    0b11000011,
+    0b11000011,
+    0b11000011,
+    0b11000011,
+    0b11111111,
+    0b01111110,
+    )))
+
+big9 = (8, 14, bytes((
+    0b01111110,
+    0b11111111,
+    0b11000011,
+    0b11000011,
+    0b11000011,
+    0b11000011,
+    0b11111111,
+    0b01111111,
+    0b00000011,
+    0b00000011,
+    0b00000011,
+    0b11000011,
+    0b11111111,
+    0b01111110,
+    )))
+
+# big_dot = (8, 14, bytes((
+#     0b00000000,
+#     0b00000000,
+#     0b00000000,
+#     0b00000000,
+#     0b00000000,
+#     0b00000000,
+#     0b00000000,
+#     0b00000000,
+#     0b00000000,
+#     0b00000000,
+#     0b00000000,
+#     0b00000000,
+#     0b00011000,
+#     0b00011000,
+#     )))
+
+# big_colon = (8, 14, bytes((
+#     0b00000000,
+#     0b00000000,
+#     0b00000000,
+#     0b00000000,
+#     0b00011000,
+#     0b00011000,
+#     0b00000000,
+#     0b00000000,
+#     0b00011000,
+#     0b00011000,
+#     0b00000000,
+#     0b00000000,
+#     0b00000000,
+#     0b00000000,
+#     )))
+
+big_dot = (2, 14, bytes((
+    0b00,
+    0b00,
+    0b00,
+    0b00,
+    0b00,
+    0b00,
+    0b00,
+    0b00,
+    0b00,
+    0b00,
+    0b00,
+    0b00,
+    0b11,
+    0b11,
+    )))
+
+big_colon = (2, 14, bytes((
+    0b00,
+    0b00,
+    0b00,
+    0b00,
+    0b11,
+    0b11,
+    0b00,
+    0b00,
+    0b11,
+    0b11,
+    0b00,
+    0b00,
+    0b00,
+    0b00,
+    )))
+
+big_degree = (4, 14, bytes((
+    0b0110,
+    0b1001,
+    0b1001,
+    0b0110,
+    0b0000,
+    0b0000,
+    0b0000,
+    0b0000,
+    0b0000,
+    0b0000,
+    0b0000,
+    0b0000,
+    0b0000,
+    0b0000,
+    )))
+
+big_degreeC = (8, 14, bytes((
+    0b01101111,
+    0b10011000,
+    0b10011000,
+    0b01101000,
+    0b00001000,
+    0b00001111,
+    0b00000000,
+    0b00000000,
+    0b00000000,
+    0b00000000,
+    0b00000000,
+    0b00000000,
+    0b00000000,
+    0b00000000,
+    )))
+
+big_percent = (8, 14, bytes((
+    0b00000000,
+    0b00000000,
+    0b11110000,
+    0b01100000,
+    0b10010011,
+    0b10010110,
+    0b01101100,
+    0b00011000,
+    0b00110110,
+    0b01101001,
+    0b11001001,
+    0b00000110,
+    0b00000000,
+    0b00000000,
+    )))
+
+big_dash = (8, 14, bytes((
+    0b00000000,
+    0b00000000,
+    0b00000000,
+    0b00000000,
+    0b00000000,
+    0b00000000,
+    0b01111110,
+    0b01111110,
+    0b00000000,
+    0b00000000,
+    0b00000000,
+    0b00000000,
+    0b00000000,
+    0b00000000,
+    )))
+
+big_space = (8, 14, bytes((
+    0b00000000,
+    0b00000000,
+    0b00000000,
+    0b00000000,
+    0b00000000,
+    0b00000000,
+    0b00000000,
+    0b00000000,
+    0b00000000,
+    0b00000000,
+    0b00000000,
+    0b00000000,
+    0b00000000,
+    0b00000000,
+    )))
 
 ##*****************************************************************************
 ##*****************************************************************************
 
-small0 = [
-    [0,1,1,1,0],
-    [1,0,0,0,1],
-    [1,0,0,0,1],
-    [1,0,0,0,1],
-    [1,0,0,0,1],
-    [1,0,0,0,1],
-    [0,1,1,1,0],
-    ]
-
-small1 = [
-    [0,0,1,0,0],
-    [0,1,1,0,0],
-    [1,0,1,0,0],
-    [0,0,1,0,0],
-    [0,0,1,0,0],
-    [0,0,1,0,0],
-    [1,1,1,1,1],
-    ]
-
-small2 = [
-    [0,1,1,1,0],
-    [1,0,0,0,1],
-    [0,0,0,0,1],
-    [0,0,0,1,0],
-    [0,0,1,0,0],
-    [0,1,0,0,0],
-    [1,1,1,1,1],
-    ]
-
-small3 = [
-    [0,1,1,1,0],
-    [1,0,0,0,1],
-    [0,0,0,0,1],
-    [0,0,0,1,0],
-    [0,0,0,0,1],
-    [1,0,0,0,1],
-    [0,1,1,1,0],
-    ]
-
-small4 = [
-    [1,0,0,0,0],
-    [1,0,0,0,0],
-    [1,0,0,1,0],
-    [1,0,0,1,0],
-    [1,1,1,1,1],
-    [0,0,0,1,0],
-    [0,0,0,1,0],
-    ]
-
-small5 = [
-    [1,1,1,1,1],
-    [1,0,0,0,0],
-    [1,1,1,1,0],
-    [0,0,0,0,1],
-    [0,0,0,0,1],
-    [1,0,0,0,1],
-    [0,1,1,1,0],
-    ]
-
-small6 = [
-    [0,1,1,1,0],
-    [1,0,0,0,1],
-    [1,0,0,0,0],
-    [1,1,1,1,0],
-    [1,0,0,0,1],
-    [1,0,0,0,1],
-    [0,1,1,1,0],
-    ]
-
-small7 = [
-    [1,1,1,1,1],
-    [0,0,0,0,1],
-    [0,0,0,1,0],
-    [0,0,1,0,0],
-    [0,0,1,0,0],
-    [0,0,1,0,0],
-    [0,0,1,0,0],
-    ]
-
-small8 = [
-    [0,1,1,1,0],
-    [1,0,0,0,1],
-    [1,0,0,0,1],
-    [0,1,1,1,0],
-    [1,0,0,0,1],
-    [1,0,0,0,1],
-    [0,1,1,1,0],
-    ]
-
-small9 = [
-    [0,1,1,1,0],
-    [1,0,0,0,1],
-    [1,0,0,0,1],
-    [0,1,1,1,1],
-    [0,0,0,0,1],
-    [1,0,0,0,1],
-    [0,1,1,1,0],
-    ]
-
-# small_dot = [
-#     [0,0,0,0,0],
-#     [0,0,0,0,0],
-#     [0,0,0,0,0],
-#     [0,0,0,0,0],
-#     [0,0,0,0,0],
-#     [0,0,0,0,0],
-#     [0,0,1,0,0],
-#     ]
-
-# small_colon = [
-#     [0,0,0,0,0],
-#     [0,0,0,0,0],
-#     [0,0,1,0,0],
-#     [0,0,0,0,0],
-#     [0,0,1,0,0],
-#     [0,0,0,0,0],
-#     [0,0,0,0,0],
-#     ]
-
-small_dot = [
-    [0],
-    [0],
-    [0],
-    [0],
-    [0],
-    [0],
-    [1],
-    ]
-
-small_colon = [
-    [0],
-    [0],
-    [1],
-    [0],
-    [1],
-    [0],
-    [0],
-    ]
-
-small_degree = [
-    [0,1,0],
-    [1,0,1],
-    [0,1,0],
-    [0,0,0],
-    [0,0,0],
-    [0,0,0],
-    [0,0,0],
-    ]
-
-small_degreeC = [
-    [0,1,0,1,1,1],
-    [1,0,1,1,0,0],
-    [0,1,0,1,0,0],
-    [0,0,0,1,1,1],
-    [0,0,0,0,0,0],
-    [0,0,0,0,0,0],
-    [0,0,0,0,0,0],
-    ]
-
-small_percent = [
-    [0,0,0,0,0],
-    [0,0,0,0,0],
-    [0,1,0,0,1],
-    [0,0,0,1,0],
-    [0,0,1,0,0],
-    [0,1,0,0,1],
-    [0,0,0,0,0],
-    ]
-
-small_dash = [
-    [0,0,0,0],
-    [0,0,0,0],
-    [0,0,0,0],
-    [1,1,1,1],
-    [0,0,0,0],
-    [0,0,0,0],
-    [0,0,0,0],
-    ]
-
-small_space = [
-    [0,0,0,0,0],
-    [0,0,0,0,0],
-    [0,0,0,0,0],
-    [0,0,0,0,0],
-    [0,0,0,0,0],
-    [0,0,0,0,0],
-    [0,0,0,0,0],
-    ]
+small0 = (5, 7, bytes((
+    0b01110,
+    0b10001,
+    0b10001,
+    0b10001,
+    0b10001,
+    0b10001,
+    0b01110,
+    )))
+
+small1 = (5, 7, bytes((
+    0b00100,
+    0b01100,
+    0b10100,
+    0b00100,
+    0b00100,
+    0b00100,
+    0b11111,
+    )))
+
+small2 = (5, 7, bytes((
+    0b01110,
+    0b10001,
+    0b00001,
+    0b00010,
+    0b00100,
+    0b01000,
+    0b11111,
+    )))
+
+small3 = (5, 7, bytes((
+    0b01110,
+    0b10001,
+    0b00001,
+    0b00010,
+    0b00001,
+    0b10001,
+    0b01110,
+    )))
+
+small4 = (5, 7, bytes((
+    0b10000,
+    0b10000,
+    0b10010,
+    0b10010,
+    0b11111,
+    0b00010,
+    0b00010,
+    )))
+
+small5 = (5, 7, bytes((
+    0b11111,
+    0b10000,
+    0b11110,
+    0b00001,
+    0b00001,
+    0b10001,
+    0b01110,
+    )))
+
+small6 = (5, 7, bytes((
+    0b01110,
+    0b10001,
+    0b10000,
+    0b11110,
+    0b10001,
+    0b10001,
+    0b01110,
+    )))
+
+small7 = (5, 7, bytes((
+    0b11111,
+    0b00001,
+    0b00010,
+    0b00100,
+    0b00100,
+    0b00100,
+    0b00100,
+    )))
+
+small8 = (5, 7, bytes((
+    0b01110,
+    0b10001,
+    0b10001,
+    0b01110,
+    0b10001,
+    0b10001,
+    0b01110,
+    )))
+
+small9 = (5, 7, bytes((
+    0b01110,
+    0b10001,
+    0b10001,
+    0b01111,
+    0b00001,
+    0b10001,
+    0b01110,
+    )))
+
+# small_dot = (5, 7, bytes((
+#     0b00000,
+#     0b00000,
+#     0b00000,
+#     0b00000,
+#     0b00000,
+#     0b00000,
+#     0b00100,
+#     )))
+
+# small_colon = (5, 7, bytes((
+#     0b00000,
+#     0b00000,
+#     0b00100,
+#     0b00000,
+#     0b00100,
+#     0b00000,
+#     0b00000,
+#     )))
+
+small_dot = (1, 7, bytes((
+    0b0,
+    0b0,
+    0b0,
+    0b0,
+    0b0,
+    0b0,
+    0b1,
+    )))
+
+small_colon = (1, 7, bytes((
+    0b0,
+    0b0,
+    0b1,
+    0b0,
+    0b1,
+    0b0,
+    0b0,
+    )))
+
+small_degree = (3, 7, bytes((
+    0b010,
+    0b101,
+    0b010,
+    0b000,
+    0b000,
+    0b000,
+    0b000,
+    )))
+
+small_degreeC = (6, 7, bytes((
+    0b010111,
+    0b101100,
+    0b010100,
+    0b000111,
+    0b000000,
+    0b000000,
+    0b000000,
+    )))
+
+small_percent = (5, 7, bytes((
+    0b00000,
+    0b00000,
+    0b01001,
+    0b00010,
+    0b00100,
+    0b01001,
+    0b00000,
+    )))
+
+small_dash = (4, 7, bytes((
+    0b0000,
+    0b0000,
+    0b0000,
+    0b1111,
+    0b0000,
+    0b0000,
+    0b0000,
+    )))
+
+small_space = (5, 7, bytes((
+    0b00000,
+    0b00000,
+    0b00000,
+    0b00000,
+    0b00000,
+    0b00000,
+    0b00000,
+    )))
 
 ##*****************************************************************************
 ##*****************************************************************************
 
-pixel_black = [
-    [0],
-    ]
+pixel_black = (1, 1, bytes((
+    0b0,
+    )))
 
-pixel_blue = [
-    [1],
-    ]
+pixel_blue = (1, 1, bytes((
+    0b1,
+    )))
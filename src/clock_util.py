@@ -0,0 +1,228 @@
+# -*- coding: utf-8 -*-
+
+"""
+Monotonic wall clock, derived from ticks_ms() and anchored by NTP.
+
+@author: mada
+@version: 2026-10-17
+"""
+
+try:
+    import uasyncio as asyncio
+except ModuleNotFoundError:
+    import asyncio
+
+from ticks_util import ticks_ms, ticks_diff
+
+##*****************************************************************************
+##*****************************************************************************
+
+## Move the anchor forward after this many ms, well before ticks_diff() wraps
+REANCHOR_MS = 1 << 28  # ~3 days
+
+## Clock discipline
+MAX_PPM = 500  # drift correction limit
+SLEW_PERIOD = 2000  # ms per 1ms slewed out, i.e. 500ppm
+STEP_MS = 1000  # offsets beyond are stepped, not slewed
+STABLE_PPM = 2  # drift estimates changing less are stable
+MIN_INTERVAL = 1024  # seconds between syncs, ~17min
+MAX_INTERVAL = 1 << 17  # ~36h
+
+##*****************************************************************************
+##*****************************************************************************
+
+
+##=============================================================================
+class Clock():
+    '''
+    Wall clock counting from an anchor timestamp with ticks_ms().
+
+    Unlike a counter incremented by a timer callback, late or missed callbacks
+    do not add up, and tasks can wait for exact second or minute boundaries.
+    The time is kept as integer seconds plus milliseconds, i.e. no floats.
+    The drift correction is applied as 1ms per `_drift_period` ticks.
+
+    The clock is disciplined by reference samples, see adjust(): the drift of
+    the crystal is estimated and corrected continuously, offsets are slewed
+    out instead of stepping the time, and the recommended `sync_interval`
+    grows while the drift estimate is stable.
+
+    Setting the clock sets the event `changed`, which also ends a wait_next()
+    early. Clear it once the new time has been handled.
+    '''
+    def __init__(self, timestamp=0, speed=1):
+        '''
+        Parameters
+        ----------
+        timestamp : int, optional
+            Current time in seconds since the epoch, e.g. time.time().
+        speed : int, optional
+            Clock seconds per real second, >1 to fast-forward for debugging.
+        '''
+        self.speed = speed
+        self.changed = asyncio.Event()
+        self.drift_ppm = 0.0  # correction of the ticks rate, parts per million
+        self._drift_period = 0  # ms per 1ms correction, 0 for none
+        self._drift_sign = 1
+        self.offset_ms = 0  # offset of the last reference sample
+        self.sync_interval = MIN_INTERVAL
+        self.syncs = 0
+        self._sync_ticks = 0
+        self._slew_ms = 0  # offset still to slew out
+        self._rem = 0  # ticks towards the next 1ms of drift correction
+        self.set(timestamp)
+
+    def set(self, timestamp, ms=0, ticks=None):
+        '''
+        Anchor the clock, e.g. after an NTP sync.
+
+        Parameters
+        ----------
+        timestamp : int
+            Seconds since the epoch ...
+        ms : int, optional
+            ... plus milliseconds ...
+        ticks : int, optional
+            ... at ticks_ms() `ticks`, defaults to now.
+        '''
+        self._seconds = timestamp
+        self._ms = ms
+        self._ticks = ticks_ms() if ticks is None else ticks
+        self._slew_ms = 0
+        self._rem = 0
+        self.changed.set()
+
+    def _at(self, elapsed):
+        '''
+        Compute the time `elapsed` ticks after the anchor.
+
+        Returns
+        -------
+        seconds, ms : int
+        slewed : int
+            Part of the offset slewed out since the anchor.
+        rem : int
+            Drift correction below 1ms.
+        '''
+        drift = 0
+        rem = 0
+        if self._drift_period:
+            drift = (self._rem + elapsed) // self._drift_period * self._drift_sign
+            rem = (self._rem + elapsed) % self._drift_period
+        slewed = max(0, elapsed) // SLEW_PERIOD
+        if self._slew_ms < 0:
+            slewed = -min(slewed, -self._slew_ms)
+        else:
+            slewed = min(slewed, self._slew_ms)
+        ms = self._ms + elapsed * self.speed + drift + slewed
+        return self._seconds + ms // 1000, ms % 1000, slewed, rem
+
+    def _anchor(self, ticks):
+        '''
+        Move the anchor to ticks_ms() `ticks`.
+        '''
+        self._seconds, self._ms, slewed, self._rem = self._at(ticks_diff(ticks, self._ticks))
+        self._slew_ms -= slewed
+        self._ticks = ticks
+
+    def now(self):
+        '''
+        Return the current time.
+
+        Returns
+        -------
+        seconds : int
+            Seconds since the epoch.
+        ms : int
+            Milliseconds 0..999.
+        '''
+        ticks = ticks_ms()
+        elapsed = ticks_diff(ticks, self._ticks)
+        if elapsed > REANCHOR_MS:
+            self._anchor(ticks)
+            elapsed = 0
+        return self._at(elapsed)[:2]
+
+    def adjust(self, seconds, ms, ticks):
+        '''
+        Steer the clock by a reference sample, e.g. from an NTP server.
+
+        The first sample and offsets beyond STEP_MS set the clock. Otherwise
+        the offset is slewed out at 500ppm, and the offset left after the
+        previous sample updates the drift estimate. The sync interval doubles
+        while the estimate changes by less than STABLE_PPM, and halves else.
+
+        Parameters
+        ----------
+        seconds, ms : int
+            Reference time ...
+        ticks : int
+            ... at ticks_ms() `ticks`.
+
+        Returns
+        -------
+        offset_ms : int
+            Reference time minus clock time.
+        '''
+        local_seconds, local_ms = self._at(ticks_diff(ticks, self._ticks))[:2]
+        offset_ms = (seconds - local_seconds) * 1000 + ms - local_ms
+        self.offset_ms = offset_ms
+
+        if self.syncs and abs(offset_ms) <= STEP_MS:
+            ## drift since the last sample, except for the offset still slewing
+            self._anchor(ticks)
+            interval = ticks_diff(ticks, self._sync_ticks)
+            error_ppm = 0
+            if interval > 0:
+                error_ppm = (offset_ms - self._slew_ms) * 1000000 / interval
+            ## half the error, to settle rather than to oscillate
+            self.drift_ppm = max(-MAX_PPM, min(MAX_PPM, self.drift_ppm + error_ppm / 2))
+            if abs(self.drift_ppm) < 0.001:
+                self._drift_period = 0
+            else:
+                self._drift_period = round(1000000 / abs(self.drift_ppm))
+            self._drift_sign = 1 if self.drift_ppm > 0 else -1
+            self._rem = 0
+            self._slew_ms = offset_ms
+            if abs(error_ppm) < STABLE_PPM:
+                self.sync_interval = min(MAX_INTERVAL, 2 * self.sync_interval)
+            else:
+                self.sync_interval = max(MIN_INTERVAL, self.sync_interval // 2)
+        else:
+            self.set(seconds, ms, ticks)
+            self.sync_interval = MIN_INTERVAL
+
+        self._sync_ticks = ticks
+        self.syncs += 1
+        return offset_ms
+
+    def time(self):
+        '''
+        Return the current time in seconds since the epoch, like time.time().
+        '''
+        return self.now()[0]
+
+    async def wait_next(self, period=1):
+        '''
+        Wait for the next multiple of `period` seconds, e.g. 60 for the next
+        full minute, or until the clock is set.
+
+        Returns
+        -------
+        timestamp : int
+            The time reached, in seconds since the epoch, or the current time
+            if the clock has been set, i.e. `changed` is set.
+        '''
+        seconds, ms = self.now()
+        target = (seconds // period + 1) * period
+        while True:
+            if self.changed.is_set():
+                return seconds
+            remaining = (target - seconds) * 1000 - ms
+            if remaining <= 0:
+                return target
+            try:
+                await asyncio.wait_for(self.changed.wait(), remaining / 1000 / self.speed)
+            except asyncio.TimeoutError:
+                pass
+            seconds, ms = self.now()
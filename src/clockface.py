@@ -0,0 +1,227 @@
+# -*- coding: utf-8 -*-
+
+"""
+Incremental drawing of the clock face lines.
+
+@author: mada
+@version: 2026-10-17
+"""
+
+import font_util
+
+##*****************************************************************************
+##*****************************************************************************
+
+
+##=============================================================================
+def _same_layout(old, new):
+    '''
+    Check whether two lines of runs place all glyph cells at the same columns.
+    '''
+    if len(old) != len(new):
+        return False
+    for (old_text, old_font, old_spacing), (text, font, spacing) in zip(old, new):
+        if font is not old_font or spacing != old_spacing or len(text) != len(old_text):
+            return False
+        for old_char, char in zip(old_text, text):
+            if old_char != char and font.advance(old_char) != font.advance(char):
+                return False
+    return True
+
+
+##=============================================================================
+class TextLine():
+    '''
+    A text line on the matrix that remembers what it has drawn.
+
+    An update redraws only the glyph cells whose character changed, and within
+    those cells only the pixels that differ. The whole line is redrawn if the
+    layout or the color changes.
+
+    The drawn line is tracked per matrix, so the line can be drawn into both
+    buffers of a framebuffer.DoubleBuffer.
+    '''
+    def __init__(self, row, alignment=font_util.CENTER, size=64, cache=None):
+        '''
+        Parameters
+        ----------
+        row : int
+            Top pixel row of the line.
+        alignment : int, optional
+            LEFT, CENTER or RIGHT, see font_util.align().
+        size : int, optional
+            Number of matrix columns.
+        cache : font_util.LineCache, optional
+            Cache for full redraws.
+        '''
+        self.row = row
+        self.alignment = alignment
+        self.size = size
+        self.cache = cache
+        self._drawn = {}  # matrix -> (runs, color, col)
+
+    def reset(self, matrix=None):
+        '''
+        Forget the drawn line, e.g. after the matrix has been cleared.
+        '''
+        if matrix is None:
+            self._drawn = {}
+        else:
+            self._drawn.pop(matrix, None)
+
+    def clear(self, matrix):
+        '''
+        Clear the pixels of the drawn line.
+        '''
+        drawn = self._drawn.pop(matrix, None)
+        if drawn is not None:
+            runs, color, col = drawn
+            font_util.draw(matrix, self.row, col, runs, font_util.BLACK)
+
+    def update(self, matrix, runs, color):
+        '''
+        Draw a new text line over the drawn one.
+
+        Parameters
+        ----------
+        matrix : matrixdata.MatrixData
+        runs : tuple
+            Runs (text, font, spacing), see font_util.measure().
+        color : int
+            Palette index.
+
+        Returns
+        -------
+        count : int
+            Number of glyph cells redrawn.
+        '''
+        drawn = self._drawn.get(matrix)
+        count = 0
+        if drawn is not None and color == drawn[1] and _same_layout(drawn[0], runs):
+            col = drawn[2]
+            c = col
+            gap = 0
+            for (text, font, spacing), (old_text, _, _) in zip(runs, drawn[0]):
+                for char, old_char in zip(text, old_text):
+                    c += gap
+                    if char != old_char:
+                        font_util.blit_diff(matrix, self.row, c, font[old_char], font[char], color)
+                        count += 1
+                    c += font.advance(char)
+                    gap = spacing
+        else:
+            self.clear(matrix)
+            if self.cache is not None:
+                col = self.cache.draw(matrix, self.row, runs, color, self.alignment, self.size)
+            else:
+                col = font_util.align(runs, self.alignment, self.size)
+                font_util.draw(matrix, self.row, col, runs, color)
+            for text, font, spacing in runs:
+                count += len(text)
+
+        self._drawn[matrix] = (runs, color, col)
+        return count
+
+
+##=============================================================================
+def format_readings(hour, minute, second, temp, hum, decimals=1):
+    '''
+    Format the clock face strings.
+
+    Parameters
+    ----------
+    hour, minute, second : int
+        Local time.
+    temp, hum : float
+        Temperature in °C and relative humidity in %, None if not available.
+    decimals : int, optional
+        Decimals of the sensor readings.
+
+    Returns
+    -------
+    time_str : str
+        HH:MM.SS
+    sensor_str : str
+    '''
+    time_str = "{:02d}:{:02d}.{:02d}".format(hour, minute, second)
+    try:
+        sensor_str = "{:{}.{}f}C {:{}.{}f}%".format(temp, 3 + decimals, decimals, hum, 3 + decimals, decimals)
+    except (TypeError, ValueError):
+        sensor_str = '----  ----'
+    return time_str, sensor_str
+
+
+##=============================================================================
+class ClockFace():
+    '''
+    The clock face: time HH:MM in 'big' on top, sensor readings in 'small' below.
+
+    In seconds mode the time line is HH:MM.SS with .SS in 'small'. A tick then
+    redraws one or two glyph cells, which keeps 1 Hz updates cheap.
+    '''
+    ## Default character spacings
+    space_big = 2    # default spacing for 'big'
+    space_small = 1  # default spacing for 'small'
+
+    def __init__(self, fonts, cache_size=4, seconds=False):
+        '''
+        Parameters
+        ----------
+        fonts : dict
+            Fonts 'big' and 'small', see font_util.load().
+        cache_size : int, optional
+            Number of composed lines to cache, each HH:MM line takes 14x42 bytes.
+        seconds : bool, optional
+            Show HH:MM.SS instead of HH:MM.
+        '''
+        self.seconds = seconds
+        self.big = fonts['big']
+        self.small = fonts['small']
+        self.cache = font_util.LineCache(cache_size)
+        self.time_line = TextLine(5, cache=self.cache)
+        self.sensor_line = TextLine(22, cache=self.cache)
+
+    def reset(self, matrix=None):
+        '''
+        Forget the drawn lines, e.g. after the matrix has been cleared.
+        '''
+        self.time_line.reset(matrix)
+        self.sensor_line.reset(matrix)
+
+    def render(self, matrix, hour, minute, second, temp, hum, color=font_util.YELLOW):
+        '''
+        Draw the readings, redrawing only the changed characters.
+
+        Parameters
+        ----------
+        matrix : matrixdata.MatrixData
+        hour, minute, second : int
+            Local time.
+        temp, hum : float
+            Sensor readings, None if not available.
+        color : int, optional
+            Palette index.
+
+        Returns
+        -------
+        time_str : str
+        sensor_str : str
+        '''
+        time_str, sensor_str = format_readings(hour, minute, second, temp, hum)
+
+        ## Time HH:MM in big chars, .SS in small chars
+        if self.seconds:
+            time_runs = ((time_str[:-3], self.big, self.space_big), (time_str[-3:], self.small, self.space_small))
+        else:
+            time_runs = ((time_str[:-3], self.big, self.space_big),)
+        ## Sensor data in small chars, without decimals if too wide, e.g. for
+        ## -12.3C 100.0%
+        sensor_runs = ((sensor_str, self.small, self.space_small),)
+        if font_util.measure(sensor_runs) > self.sensor_line.size:
+            sensor_str = format_readings(hour, minute, second, temp, hum, 0)[1]
+            sensor_runs = ((sensor_str, self.small, self.space_small),)
+
+        ## Center the lines on screen
+        self.time_line.update(matrix, time_runs, color)
+        self.sensor_line.update(matrix, sensor_runs, color)
+        return time_str, sensor_str
@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+
+"""
+Night time settings of the display: dim colors, lower refresh rate and
+shorter illumination.
+
+@author: mada
+@version: 2026-10-17
+"""
+
+import font_util
+
+##*****************************************************************************
+##*****************************************************************************
+
+## Palette index -> dim palette index, keeping one color channel, red first
+DIM = bytes((
+    font_util.BLACK,
+    font_util.BLUE,
+    font_util.GREEN,
+    font_util.GREEN,  # CYAN
+    font_util.RED,
+    font_util.RED,  # MAGENTA
+    font_util.RED,  # YELLOW
+    font_util.RED,  # WHITE
+    ))
+
+##*****************************************************************************
+##*****************************************************************************
+
+
+##=============================================================================
+class Darkmode():
+    '''
+    Darkmode hours and the display settings to use during them.
+
+    Colors are dimmed by mapping the palette index, so the clock face redraws
+    the lines when darkmode starts or ends, see clockface.TextLine.
+    '''
+    def __init__(self, start=20, end=7, refresh_rate=100, illumination_time_us=1):
+        '''
+        Parameters
+        ----------
+        start : int, optional
+            First hour of darkmode, local time.
+        end : int, optional
+            First hour after darkmode, local time.
+        refresh_rate : int, optional
+            Refresh rate in Hz during darkmode, high enough not to flicker.
+        illumination_time_us : int, optional
+            hub75.Hub75SpiConfiguration.illumination_time_microseconds during
+            darkmode.
+        '''
+        self.start = start
+        self.end = end
+        self.refresh_rate = refresh_rate
+        self.illumination_time_us = illumination_time_us
+        self.active = False
+
+    def is_dark(self, hour):
+        '''
+        Check whether darkmode applies to an hour, wrapping past midnight.
+        '''
+        if self.start <= self.end:
+            return self.start <= hour < self.end
+        return hour >= self.start or hour < self.end
+
+    def update(self, hour):
+        '''
+        Switch darkmode on or off for the hour.
+
+        Returns
+        -------
+        changed : bool
+            True if darkmode has been switched.
+        '''
+        active = self.is_dark(hour)
+        changed = active != self.active
+        self.active = active
+        return changed
+
+    def color(self, color):
+        '''
+        Map a palette index to its dim variant while darkmode is active.
+        '''
+        if self.active:
+            return DIM[color]
+        return color
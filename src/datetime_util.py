@@ -3,8 +3,13 @@
 """
 Useful clock related functions.
 
+The calendar conversions days_from_civil() and civil_from_days() use small
+integers only, see http://howardhinnant.github.io/date_algorithms.html, so
+timestamp() and timetuple() work for any date and epoch, unlike time.mktime()
+and time.localtime() on some ports.
+
 @author: mada
-@version: 2023-03-03
+@version: 2026-10-17
 """
 
 try:
@@ -15,55 +20,147 @@ except ModuleNotFoundError:
 ##*****************************************************************************
 ##*****************************************************************************
 
+## Days from 1970-01-01 to the epoch of time.time(), 2000-01-01 on some ports
+if time.gmtime(0)[0] == 2000:
+    EPOCH_DAYS = 10957
+else:
+    EPOCH_DAYS = 0
+
+DAY = 86400
+
+## Days before the first of a month, in a common year
+_DAYS_BEFORE_MONTH = (0, 31, 59, 90, 120, 151, 181, 212, 243, 273, 304, 334)
+
+##*****************************************************************************
+##*****************************************************************************
+
+
+##=============================================================================
+def days_from_civil(year, month, day):
+    '''
+    Count the days from 1970-01-01 to a date of the proleptic Gregorian
+    calendar, negative before.
+    '''
+    ## years starting on March 1st, the leap day is the last day of a year
+    if month <= 2:
+        year -= 1
+        month += 9
+    else:
+        month -= 3
+    era = year // 400
+    year_of_era = year - era * 400
+    day_of_year = (153 * month + 2) // 5 + day - 1
+    day_of_era = year_of_era * 365 + year_of_era // 4 - year_of_era // 100 + day_of_year
+    return era * 146097 + day_of_era - 719468
+
+
+##=============================================================================
+def civil_from_days(days):
+    '''
+    Convert days from 1970-01-01 to a date, see days_from_civil().
+
+    Returns
+    -------
+    year : int
+    month : int
+    day : int
+    '''
+    days += 719468
+    era = days // 146097
+    day_of_era = days - era * 146097
+    year_of_era = (day_of_era - day_of_era // 1460 + day_of_era // 36524 - day_of_era // 146096) // 365
+    day_of_year = day_of_era - (365 * year_of_era + year_of_era // 4 - year_of_era // 100)
+    month = (5 * day_of_year + 2) // 153  # March is 0
+    day = day_of_year - (153 * month + 2) // 5 + 1
+    if month < 10:
+        month += 3
+    else:
+        month -= 9
+    return year_of_era + era * 400 + (month <= 2), month, day
+
+
+##=============================================================================
+def _day_of_year(year, month, day):
+    '''
+    Day of the year, January 1st is 1.
+    '''
+    day += _DAYS_BEFORE_MONTH[month - 1]
+    if month > 2 and year % 4 == 0 and (year % 100 != 0 or year % 400 == 0):
+        day += 1
+    return day
+
+
+##=============================================================================
+def timestamp(time_tuple, epoch_days=EPOCH_DAYS):
+    '''
+    Convert a UTC time tuple to seconds since the epoch, like time.mktime()
+    without time zone.
+
+    Parameters
+    ----------
+    time_tuple : tuple/iterable
+        (year, month, day, hour, minute, second, ...), further items ignored.
+    epoch_days : int, optional
+        Days from 1970-01-01 to the epoch, 10957 for 2000-01-01.
+    '''
+    year, month, day, hour, minute, second = time_tuple[:6]
+    return (days_from_civil(year, month, day) - epoch_days) * DAY + hour * 3600 + minute * 60 + second
+
+
+##=============================================================================
+def timetuple(ts, epoch_days=EPOCH_DAYS):
+    '''
+    Convert seconds since the epoch to a UTC time tuple, like time.gmtime().
+
+    Parameters
+    ----------
+    ts : int
+    epoch_days : int, optional
+        Days from 1970-01-01 to the epoch, 10957 for 2000-01-01.
+
+    Returns
+    -------
+    time_tuple : tuple
+        See get_timetuple().
+    '''
+    days, seconds = divmod(int(ts), DAY)
+    days += epoch_days
+    year, month, day = civil_from_days(days)
+    return (year, month, day, seconds // 3600, seconds // 60 % 60, seconds % 60,
+            (days + 3) % 7, _day_of_year(year, month, day), -1)
+
 
 ##=============================================================================
 def _daylightSavingOffset(ts_utc=time.time()):
     '''
-    https://forum.micropython.org/viewtopic.php?f=2&t=4034
+    Offset of the Central European Time to UTC, see tz_util.CET.
 
     Returns
     -------
     offset : int
         daylight saving offset in seconds
     '''
-    year = time.localtime(ts_utc)[0]  # get current year
-    HHMarch   = time.mktime((year,  3, (31 - (int(5 * year / 4 + 4)) % 7), 1,0,0,0,0,0))  # noqa # Time of March change to CEST
-    HHOctober = time.mktime((year, 10, (31 - (int(5 * year / 4 + 1)) % 7), 1,0,0,0,0,0))  # noqa # Time of October change to CET
-
-    if ts_utc < HHMarch:
-        ## we are before last Sunday of March
-        offset = 3600  # CET: UTC+1H
-    elif ts_utc < HHOctober:
-        ## we are before last Sunday of October
-        offset = 7200  # CEST: UTC+2H
-    else:
-        ## we are after last Sunday of October
-        offset = 3600  # CEST: UTC+1H
-
-    return offset
+    import tz_util  # not at the top, tz_util imports this module
+    return tz_util.CET.offset(ts_utc)
 
 
 ##=============================================================================
 def cettime(ts_utc=time.time()):
     '''
-    https://forum.micropython.org/viewtopic.php?f=2&t=4034
-
     Return the Central European Time (CET) including daylight saving.
 
     Winter (CET) is UTC+1H Summer (CEST) is UTC+2H.
 
     Changes happen last Sundays of March (CEST) and October (CET) at 01:00 UTC.
-    Ref. formulas : http://www.webexhibits.org/daylightsaving/i.html
-                    Since 1996, valid through 2099
+    Other zones, see tz_util.
+
     Returns
     -------
-    ts_cet : float
-        timestamp for CET
+    ts_cet : tuple
+        time tuple for CET
     '''
-    offset = _daylightSavingOffset(ts_utc)
-    ts_cet = time.localtime(ts_utc + offset)
-
-    return ts_cet
+    import tz_util  # not at the top, tz_util imports this module
+    return tz_util.CET.localtime(ts_utc)
 
 
 ##=============================================================================
@@ -142,12 +239,9 @@ def get_timetuple(short_time_tuple):
         placeholder for the daylight savings time flag (N/A here).
     '''
     year, month, day, hour, minute, second = short_time_tuple
-    days_since_jan1 = (31, 28 + (year % 4 == 0), 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
-    day_of_year = sum(days_since_jan1[:month - 1]) + day
-    days_since_1900 = (year - 1900) * 365 + (year - 1901) // 4 + day_of_year - 1
-    days_since_1970 = days_since_1900 - 25568
-    day_of_week = (days_since_1970 + 4) % 7
-    # seconds_since_midnight = hour * 3600 + minute * 60 + second
+    days_since_1970 = days_from_civil(year, month, day)
+    day_of_week = (days_since_1970 + 3) % 7
+    day_of_year = _day_of_year(year, month, day)
 
     return year, month, day, hour, minute, second, day_of_week, day_of_year, -1
 
@@ -189,9 +283,10 @@ if __name__ == '__main__':
     localtime_full = get_timetuple(localtime_short)
     print(localtime_full)
     print("> convert full time tuple to seconds since the epoch")
-    seconds_since_epoch = time.mktime(localtime_full)
+    seconds_since_epoch = timestamp(localtime_full)
     print(seconds_since_epoch)
     print("> convert seconds to a full time tuple with weekday and yearday")
-    ## TODO: this fails on ESP32 with OverflowError: overflow converting long int to machine word
-    full_time_tuple = time.localtime(seconds_since_epoch)
+    ## time.localtime() fails here on ESP32 with OverflowError: overflow
+    ## converting long int to machine word, 1970 being before its epoch
+    full_time_tuple = timetuple(seconds_since_epoch)
     print(full_time_tuple)
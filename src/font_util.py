@@ -0,0 +1,380 @@
+# -*- coding: utf-8 -*-
+
+"""
+Loading and drawing of the dot matrix fonts.
+
+The glyphs are defined in characters.py and compiled into characters.bin by
+tools/font_compiler.py, which also documents the file layout.
+
+@author: mada
+@version: 2026-10-17
+"""
+
+import struct
+
+##*****************************************************************************
+##*****************************************************************************
+
+MAGIC = b'MXF1'
+HEADER = '<4sBH'
+INDEX_ENTRY = '<BHBBH'
+
+## Palette indices, named after the default 3-bit RGB colors, e.g. yellow #110b
+BLACK = 0
+BLUE = 1
+GREEN = 2
+CYAN = 3
+RED = 4
+MAGENTA = 5
+YELLOW = 6
+WHITE = 7
+
+## Palette index -> 3-bit RGB color, remap entries for other color schemes
+palette = bytearray((0, 1, 2, 3, 4, 5, 6, 7))
+
+## Text alignments
+LEFT = 0
+CENTER = 1
+RIGHT = 2
+
+
+##=============================================================================
+class Font():
+    '''
+    One face of a binary font file, indexed by character like a dict.
+
+    The glyph rows stay in the shared file buffer, and the glyph tuples are
+    created on first use only.
+    '''
+    def __init__(self, name, buf):
+        self.name = name
+        self.height = 0
+        self._buf = buf
+        self._index = {}
+        self._glyphs = {}
+
+    def __getitem__(self, char):
+        try:
+            return self._glyphs[char]
+        except KeyError:
+            width, height, offset = self._index[char]
+            glyph = (width, height, self._buf[offset:offset + height])
+            self._glyphs[char] = glyph
+            return glyph
+
+    def __contains__(self, char):
+        return char in self._index
+
+    def advance(self, char):
+        '''
+        Width of a glyph in pixels, from the index without loading the glyph.
+        '''
+        return self._index[char][0]
+
+
+##=============================================================================
+def load(path='characters.bin'):
+    '''
+    Read a binary font file.
+
+    Parameters
+    ----------
+    path : str
+
+    Returns
+    -------
+    fonts : dict
+        Font per face name, e.g. 'big' and 'small'.
+    '''
+    with open(path, 'rb') as f:
+        buf = memoryview(f.read())
+
+    magic, n_faces, n_glyphs = struct.unpack_from(HEADER, buf, 0)
+    if magic != MAGIC:
+        raise ValueError("no font file: {}".format(path))
+    pos = struct.calcsize(HEADER)
+
+    faces = []
+    for _ in range(n_faces):
+        size = buf[pos]
+        faces.append(Font(str(bytes(buf[pos + 1:pos + 1 + size]), 'ascii'), buf))
+        pos += 1 + size
+
+    entry_size = struct.calcsize(INDEX_ENTRY)
+    for _ in range(n_glyphs):
+        face_no, code, width, height, offset = struct.unpack_from(INDEX_ENTRY, buf, pos)
+        font = faces[face_no]
+        font._index[chr(code)] = (width, height, offset)
+        font.height = max(font.height, height)
+        pos += entry_size
+
+    return {font.name: font for font in faces}
+
+
+##=============================================================================
+def blit(matrix, row, col, glyph, color):
+    '''
+    Draw a packed glyph onto the matrix in a palette color.
+
+    Only the set pixels are written, i.e. the background is left untouched.
+
+    Parameters
+    ----------
+    matrix : matrixdata.MatrixData
+    row : int
+        Top pixel row.
+    col : int
+        Left pixel column.
+    glyph : tuple
+        Packed glyph (width, height, rows).
+    color : int
+        Palette index 0..7.
+
+    Returns
+    -------
+    width : int
+        Glyph width in pixels.
+    '''
+    width, height, rows = glyph
+    color = palette[color]
+    msb = 1 << (width - 1)
+    for r in range(height):
+        bits = rows[r]
+        c = col
+        mask = msb
+        while bits:
+            if bits & mask:
+                matrix.set_pixel_value(row + r, c, color)
+                bits ^= mask
+            mask >>= 1
+            c += 1
+    return width
+
+
+##=============================================================================
+def blit_diff(matrix, row, col, old, new, color):
+    '''
+    Replace a drawn glyph by another one of the same width.
+
+    Only the pixels that differ between both glyphs are written: the pixels
+    set in `new` only get the color, the pixels set in `old` only are cleared.
+
+    Parameters
+    ----------
+    matrix : matrixdata.MatrixData
+    row : int
+        Top pixel row.
+    col : int
+        Left pixel column.
+    old : tuple
+        Packed glyph currently drawn in the same palette color.
+    new : tuple
+        Packed glyph to draw.
+    color : int
+        Palette index 0..7.
+
+    Returns
+    -------
+    count : int
+        Number of pixels written.
+    '''
+    width, height, rows = new
+    old_height, old_rows = old[1], old[2]
+    color = palette[color]
+    msb = 1 << (width - 1)
+    count = 0
+    for r in range(max(height, old_height)):
+        bits = rows[r] if r < height else 0
+        changed = bits ^ (old_rows[r] if r < old_height else 0)
+        c = col
+        mask = msb
+        while changed:
+            if changed & mask:
+                matrix.set_pixel_value(row + r, c, color if bits & mask else 0)
+                changed ^= mask
+                count += 1
+            mask >>= 1
+            c += 1
+    return count
+
+
+##=============================================================================
+def measure(runs):
+    '''
+    Compute the pixel width of a text line.
+
+    A line consists of runs of characters set in one font each, e.g. HH:MM in
+    'big' followed by .SS in 'small'. Characters are separated by the spacing
+    of the run the preceding character belongs to.
+
+    Parameters
+    ----------
+    runs : tuple/iterable
+        Runs (text, font, spacing).
+
+    Returns
+    -------
+    width : int
+    '''
+    width = 0
+    gap = 0
+    for text, font, spacing in runs:
+        for char in text:
+            width += gap + font.advance(char)
+            gap = spacing
+    return width
+
+
+##=============================================================================
+def align(runs, alignment=CENTER, size=64):
+    '''
+    Compute the starting column of a text line.
+
+    Centered lines are rounded to the right if they do not fit exactly.
+
+    Parameters
+    ----------
+    runs : tuple/iterable
+        Runs (text, font, spacing), see measure().
+    alignment : int, optional
+        LEFT, CENTER or RIGHT.
+    size : int, optional
+        Number of matrix columns.
+
+    Returns
+    -------
+    col : int
+    '''
+    if alignment == LEFT:
+        return 0
+    return position(measure(runs), alignment, size)
+
+
+##=============================================================================
+def position(width, alignment=CENTER, size=64):
+    '''
+    Compute the starting column of a line of known pixel width, see align().
+
+    Lines wider than `size` start at column 0.
+    '''
+    if alignment == LEFT or width >= size:
+        return 0
+    if alignment == RIGHT:
+        return size - width
+    return (size - width + 1) // 2
+
+
+##=============================================================================
+def draw(matrix, row, col, runs, color):
+    '''
+    Draw a text line onto the matrix, see measure() for the runs.
+
+    Returns
+    -------
+    col : int
+        Column after the last character.
+    '''
+    gap = 0
+    for text, font, spacing in runs:
+        for char in text:
+            col += gap
+            col += blit(matrix, row, col, font[char], color)
+            gap = spacing
+    return col
+
+
+##=============================================================================
+class Bitmap():
+    '''
+    Off-screen pixel rows with the drawing interface of matrixdata.MatrixData.
+
+    The rows can be drawn in one go with MatrixData.set_pixels().
+    '''
+    def __init__(self, height, width):
+        self.rows = [bytearray(width) for _ in range(height)]
+
+    def set_pixel_value(self, row, col, value):
+        self.rows[row][col] = value
+
+
+##=============================================================================
+def compose(runs, color):
+    '''
+    Render a text line into pixel rows, see measure() for the runs.
+
+    Returns
+    -------
+    rows : list
+        One bytearray of 3-bit RGB colors per pixel row, unset pixels are 0.
+    '''
+    height = 0
+    for text, font, spacing in runs:
+        height = max(height, font.height)
+    bitmap = Bitmap(height, measure(runs))
+    draw(bitmap, 0, 0, runs, color)
+    return bitmap.rows
+
+
+##=============================================================================
+class LineCache():
+    '''
+    Bounded LRU cache of composed text lines, see compose().
+
+    Lines are keyed by their runs and color, so redrawing an unchanged line
+    costs a single MatrixData.set_pixels() call. A `size` of 0 disables the
+    caching.
+    '''
+    def __init__(self, size=4):
+        self.size = size
+        self.hits = 0
+        self.misses = 0
+        self._lines = {}
+        self._keys = []  # least recently used first
+
+    def __len__(self):
+        return len(self._keys)
+
+    def get(self, runs, color):
+        '''
+        Return the composed line, composing it on a cache miss.
+        '''
+        key = (runs, color)
+        try:
+            rows = self._lines[key]
+        except KeyError:
+            self.misses += 1
+            rows = compose(runs, color)
+            if self.size <= 0:
+                return rows
+            if len(self._keys) >= self.size:
+                del self._lines[self._keys.pop(0)]
+            self._lines[key] = rows
+            self._keys.append(key)
+            return rows
+
+        self.hits += 1
+        if self._keys[-1] != key:
+            self._keys.remove(key)
+            self._keys.append(key)
+        return rows
+
+    def draw(self, matrix, row, runs, color, alignment=CENTER, size=64):
+        '''
+        Draw an aligned text line onto the matrix.
+
+        Unlike blit() and draw(), this also clears the unset pixels and the
+        character spacings of the line.
+
+        Returns
+        -------
+        col : int
+            Starting column of the line.
+        '''
+        rows = self.get(runs, color)
+        col = position(len(rows[0]), alignment, size)
+        matrix.set_pixels(row, col, rows)
+        return col
+
+    def clear(self):
+        self._lines = {}
+        self._keys = []
@@ -0,0 +1,160 @@
+# -*- coding: utf-8 -*-
+
+"""
+Double-buffered frames for the HUB75 driver.
+
+@author: mada
+@version: 2026-10-17
+"""
+
+try:
+    import uasyncio as asyncio
+except ModuleNotFoundError:
+    import asyncio
+
+try:
+    ThreadSafeFlag = asyncio.ThreadSafeFlag
+except AttributeError:
+    ## CPython
+    class ThreadSafeFlag():
+        '''
+        Stand-in for uasyncio.ThreadSafeFlag: an event cleared by wait(),
+        which may be set from another thread.
+        '''
+        def __init__(self):
+            self._event = asyncio.Event()
+            self._loop = None
+
+        def set(self):
+            if self._loop is None:
+                self._event.set()
+                return
+            try:
+                self._loop.call_soon_threadsafe(self._event.set)
+            except RuntimeError:
+                ## loop closed
+                pass
+
+        async def wait(self):
+            self._loop = asyncio.get_running_loop()
+            await self._event.wait()
+            self._event.clear()
+
+##*****************************************************************************
+##*****************************************************************************
+
+## The frame counter wraps like ticks_ms(), so it stays a small int on the
+## device; take differences with frames_diff()
+FRAMES_MASK = 0x3FFFFFFF
+
+##*****************************************************************************
+##*****************************************************************************
+
+
+##=============================================================================
+def frames_diff(frames1, frames2):
+    '''
+    Number of frames from counter value `frames2` to `frames1`, see FRAMES_MASK.
+    '''
+    return (frames1 - frames2) & FRAMES_MASK
+
+
+##=============================================================================
+class DoubleBuffer():
+    '''
+    Two matrixdata.MatrixData buffers, one scanned out and one drawn into.
+
+    The renderer draws the next frame into `back` and publishes it. The refresh
+    path swaps the buffers between two frames by exchanging the references,
+    so a partly drawn frame is never scanned out and the refresh never waits
+    for the renderer.
+
+    The handoff needs no lock: publishing bumps the generation counter, and
+    the refresh path swaps in the back buffer as ready-frame slot whenever
+    the shown generation lags behind. Both sides only ever write their own
+    counter.
+
+    The refresh path may run in a thread of its own. Then the renderer must not
+    touch `back` while a published frame is pending, since it may be swapped
+    in at any time; await wait_free() before drawing. The swap signals the
+    thread-safe flag `swapped`, which a single task may wait for.
+
+    Buffers are not copied on a swap, i.e. `back` then holds the frame before
+    the published one. Incremental renderers have to track the contents per
+    buffer, see clockface.TextLine.
+    '''
+    def __init__(self, hub75spi, front, back):
+        '''
+        Parameters
+        ----------
+        hub75spi : hub75.Hub75Spi
+            Driver currently scanning out `front`.
+        front : matrixdata.MatrixData
+        back : matrixdata.MatrixData
+        '''
+        self.hub75spi = hub75spi
+        self.front = front
+        self.back = back
+        self.generation = 0  # frames published by the renderer
+        self.shown = 0  # generation scanned out
+        self.frames = 0  # frames scanned out, wrapping at FRAMES_MASK
+        self.published = asyncio.Event()  # set by publish(), cleared by the consumer
+        self.swapped = ThreadSafeFlag()  # set by swap(), see wait_free()
+
+    @property
+    def pending(self):
+        return self.shown != self.generation
+
+    async def wait_free(self):
+        '''
+        Wait until the published frame has been swapped in, i.e. until the
+        back buffer may be drawn into.
+        '''
+        while self.shown != self.generation:
+            ## a stale flag of an earlier swap only repeats the check
+            await self.swapped.wait()
+
+    def publish(self):
+        '''
+        Mark the back buffer as complete, to be shown from the next frame on.
+
+        Returns
+        -------
+        generation : int
+            Number of the published frame.
+        '''
+        self.generation += 1
+        self.published.set()
+        return self.generation
+
+    def swap(self):
+        '''
+        Show the published back buffer, if any.
+
+        Returns
+        -------
+        swapped : bool
+        '''
+        generation = self.generation
+        if generation == self.shown:
+            return False
+        self.front, self.back = self.back, self.front
+        self.hub75spi.matrix_data = self.front
+        self.shown = generation
+        self.swapped.set()
+        return True
+
+    def display_data(self):
+        '''
+        Scan out one frame, swapping in a published frame first.
+        '''
+        self.swap()
+        self.hub75spi.display_data()
+        self.frames = (self.frames + 1) & FRAMES_MASK
+
+    def clear_all_bytes(self):
+        '''
+        Clear both buffers.
+        '''
+        self.front.clear_all_bytes()
+        self.back.clear_all_bytes()
@@ -6,16 +6,14 @@ MatrixClock - an ESP32 driven HUB75 LED matrix clock.
 * Temperature/humidity ambient sensor (Sensirion SHT40).
 
 @author: mada
-@version: 2023-12-09
+@version: 2026-10-17
 """
 
 ## System modules
-from machine import Timer
 from machine import Pin
 from machine import I2C
 
-import ntptime
-
+import _thread
 import uasyncio as asyncio
 import utime as time
 
@@ -26,8 +24,16 @@ from logo import logo
 
 ## Custom modules
 import wlan_util  # => creds.py
-import datetime_util
-import characters
+import clock_util
+import font_util
+import clockface
+import darkmode
+import framebuffer
+import ntp_util
+import profile_util
+import rowscan
+import sht40_util
+import tz_util
 
 ##*****************************************************************************
 ##*****************************************************************************
@@ -37,16 +43,75 @@ debug_mode = False
 # debug_mode = True
 
 ## NTP sync interval ----------------------------------------------------------
-ntp_interval = 3600 * 12  # 3600s = 60min = 1h
+## Adapts to the drift of the clock, 1024s .. 36h, see clock_util.Clock.adjust()
+ntp_hosts = ('0.pool.ntp.org', '1.pool.ntp.org', '2.pool.ntp.org')
+## Resolving blocks, so the addresses are kept until a sync fails or a host
+## did not resolve; pool addresses rotate and go offline over time
+ntp_addrs = []
+ntp_rounds = 3  # queries per server and attempt
+ntp_quorum = 2  # servers agreeing on the time
+ntp_retry_interval = 30  # seconds, after 5 failed attempts
+ntp_timeout = 1  # seconds per attempt
+ntp_backoff = 1  # seconds before the first retry, doubled for every retry
 ts_ntpsync = 0
 
+## Clock face -----------------------------------------------------------------
+## Show HH:MM.SS updated every second, else HH:MM updated every 10 seconds
+show_seconds = True
+update_interval = 1 if show_seconds else 10
+## Time budget for drawing one update, exceeding it is reported
+render_budget_us = 20000
+render_us = 0
+
+## Time zone ------------------------------------------------------------------
+## Local time and daylight saving rules, see tz_util
+timezone = tz_util.CET
+
+## Display refresh -----------------------------------------------------------
+## 'asyncio': refresh as cooperative task, 'thread': refresh in its own thread,
+## 'timer': row by row from a timer interrupt at a constant rate
+refresh_mode = 'asyncio'
+# refresh_mode = 'thread'
+# refresh_mode = 'timer'
+scan_rate = 100  # Hz, 'timer' mode only
+refresh_report_interval = 60  # seconds
+## Minimum time between two frames, 0 refreshes as fast as possible
+refresh_period_ms = 0
+scanner = None  # rowscan.RowScanner in 'timer' mode
+
+## Darkmode -------------------------------------------------------------------
+## Dim colors, lower refresh rate and illumination time during night time
+night = darkmode.Darkmode(start=20, end=7, refresh_rate=75, illumination_time_us=1)
+
+## Profiling ------------------------------------------------------------------
+## Task run times, handoff waits, loop lag and frame intervals in preallocated
+## histograms, print them with prof.dump() from the REPL. Off by default, it
+## wraps every frame and wakes the event loop every 100ms for the loop lag
+profiling = False
+profile_dump_interval = 0  # seconds, 0: on demand only
+
+prof = profile_util.Profiler()
+hist_clock_run = prof.histogram('set_clock run')
+hist_clock_wait = prof.histogram('set_clock handoff wait')
+hist_clock_lag = prof.histogram('set_clock lag')
+hist_ntp_run = prof.histogram('sync_time_NTP run')
+hist_refresh_run = prof.histogram('refresh_display run')
+hist_refresh_interval = prof.histogram('refresh_display frame interval')
+hist_loop_lag = prof.histogram('event loop lag')
+
+## Sensor ---------------------------------------------------------------------
+## Sensor is sampled every 10 seconds, readings older than 30s are not shown
+sensor_interval = 10
+sensor_max_age = 30
+
 ## Init clock -----------------------------------------------------------------
+## Derived from ticks_ms(), disciplined by the NTP syncs
 if debug_mode:
-    ## Start at 05:59:00 UTC = 06:59:00 CET ...
-    ts_clocktick = 60 * 60 * 5 + 59 * 60
+    ## Start at 05:59:00 UTC = 06:59:00 CET ... and run 5x faster
+    clock = clock_util.Clock(60 * 60 * 5 + 59 * 60, speed=5)
 else:
     ## Start at 00:00:00 UTC
-    ts_clocktick = time.time()
+    clock = clock_util.Clock(time.time())
 
 ## HUB75 LED matrix with custom pinout ----------------------------------------
 config = hub75.Hub75SpiConfiguration()
@@ -70,133 +135,66 @@ config.output_enable_pin_number = 17  # active low
 config.spi_miso_pin_number = 13  # not connected
 ## Misc
 # config.illumination_time_microseconds = 1
+illumination_time_us = config.illumination_time_microseconds  # daytime
 
 matrix = matrixdata.MatrixData(row_size=32, col_size=64)
-matrix.record_dirty_bytes = True
+## The clock face lines clear their own pixels, see clockface.TextLine
+matrix.record_dirty_bytes = False
 
 hub75spi = hub75.Hub75Spi(matrix, config)
 
+## Back buffer to draw the next frame into, swapped in between two frames
+matrix_back = matrixdata.MatrixData(row_size=32, col_size=64)
+matrix_back.record_dirty_bytes = False
+frames = framebuffer.DoubleBuffer(hub75spi, matrix, matrix_back)
+
+## Refreshed via the frame profiler, print(display) shows refresh rate & jitter
+if profiling:
+    display = profile_util.FrameProfiler(frames, run_hist=hist_refresh_run, gap_hist=hist_refresh_interval)
+else:
+    display = frames
+
 ## Dot matrix characters ------------------------------------------------------
-## Characters are 2D arrays with 0..7 for 3-bit colors RGB
-## Blue is #001b, i.e. 1
-big_blue = {
-    '0' : characters.big0,         # 8 x14
-    '1' : characters.big1,         # 8 x14
-    '2' : characters.big2,         # 8 x14
-    '3' : characters.big3,         # 8 x14
-    '4' : characters.big4,         # 8 x14
-    '5' : characters.big5,         # 8 x14
-    '6' : characters.big6,         # 8 x14
-    '7' : characters.big7,         # 8 x14
-    '8' : characters.big8,         # 8 x14
-    '9' : characters.big9,         # 8 x14
-    '.' : characters.big_dot,      # 2 x14
-    ':' : characters.big_colon,    # 2 x14
-    '°' : characters.big_degree,   # 4 x14
-    'C' : characters.big_degreeC,  # 8 x14
-    '%' : characters.big_percent,  # 8 x14
-    '-' : characters.big_dash,     # 8 x14
-    ' ' : characters.big_space,    # 8 x14
-    '~' : characters.pixel_black,  # 1 x1
-    }
-
-small_blue = {
-    '0' : characters.small0,         # 5 x7
-    '1' : characters.small1,         # 5 x7
-    '2' : characters.small2,         # 5 x7
-    '3' : characters.small3,         # 5 x7
-    '4' : characters.small4,         # 5 x7
-    '5' : characters.small5,         # 5 x7
-    '6' : characters.small6,         # 5 x7
-    '7' : characters.small7,         # 5 x7
-    '8' : characters.small8,         # 5 x7
-    '9' : characters.small9,         # 5 x7
-    '.' : characters.small_dot,      # 1 x7
-    ':' : characters.small_colon,    # 1 x7
-    '°' : characters.small_degree,   # 3 x7
-    'C' : characters.small_degreeC,  # 6 x7
-    '%' : characters.small_percent,  # 5 x7
-    '-' : characters.small_dash,     # 4 x7
-    ' ' : characters.small_space,    # 5 x7
-    '~' : characters.pixel_black,    # 1 x1
-    }
-
-## Yellow is #110b, i.e. 6
-big_yellow = {}
-for char in big_blue:
-    big_yellow[char] = []
-    for i, row in enumerate(big_blue[char]):
-        row = [col * 6 for col in row]  # yellow
-        big_yellow[char].append(row)
-small_yellow = {}
-for char in small_blue:
-    small_yellow[char] = []
-    for i, row in enumerate(small_blue[char]):
-        row = [col * 6 for col in row]  # yellow
-        small_yellow[char].append(row)
+## Characters are packed 1-bit masks, colored from font_util.palette when drawn
+## 'big' is 8x14 and 'small' is 5x7 for the digits, see characters.py
+fonts = font_util.load('characters.bin')
+
+## Clock face, redrawn glyph by glyph, with a cache of composed lines
+line_cache_size = 4
+face = clockface.ClockFace(fonts, line_cache_size, show_seconds)
 
 ## SHT40 temperature & pressure sensor ----------------------------------------
-modes = (
-    ("SERIAL_NUMBER", 0x89, "Serial number", 0.01),
-    ("NOHEAT_HIGHPRECISION", 0xFD, "No heater, high precision", 0.01),
-    ("NOHEAT_MEDPRECISION", 0xF6, "No heater, med precision", 0.005),
-    ("NOHEAT_LOWPRECISION", 0xE0, "No heater, low precision", 0.002),
-    ("HIGHHEAT_1S", 0x39, "High heat, 1 second", 1.1),
-    ("HIGHHEAT_100MS", 0x32, "High heat, 0.1 second", 0.11),
-    ("MEDHEAT_1S", 0x2F, "Med heat, 1 second", 1.1),
-    ("MEDHEAT_100MS", 0x24, "Med heat, 0.1 second", 0.11),
-    ("LOWHEAT_1S", 0x1E, "Low heat, 1 second", 1.1),
-    ("LOWHEAT_100MS", 0x15, "Low heat, 0.1 second", 0.11),
-    )
+sensor_mode = sht40_util.modes[1]  # NOHEAT_HIGHPRECISION
 i2c = I2C(0, scl=Pin(22), sda=Pin(21))
 i2c_devs = i2c.scan()
 print("\n>> found I2C devices:", i2c_devs)
 sht40 = i2c_devs[0]
+sensor = sht40_util.Sampler(i2c, sht40, sensor_mode, sensor_interval, max_age=sensor_max_age)
 
 ##*****************************************************************************
 ##*****************************************************************************
 
 
 ##=============================================================================
-def read_sensor():
+def set_clock(timestamp=None, color=font_util.YELLOW):
     '''
-    Read measurement data from Sensirion SHT40.
+    Update the display readings.
 
-    Returns
-    -------
-    * t_degC : float
-    * rh_pRH : float
+    Parameters
+    ----------
+    timestamp : int, optional
+        UTC timestamp, defaults to the running clock.
+    color : int, optional
+        Palette index, see font_util.palette.
     '''
-    # print ("\n>> reading sensor data ...")
-    mode =  modes[1]  # NOHEAT_HIGHPRECISION
-    i2c.writeto(sht40, bytearray([mode[1]]))
-    time.sleep(mode[-1])
-    rx_bytes = i2c.readfrom(sht40, 6)
-    # print('>', rx_bytes, len(rx_bytes))
-    t_ticks = rx_bytes[0] * 256 + rx_bytes[1]
-    rh_ticks = rx_bytes[3] * 256 + rx_bytes[4]
-    t_degC = -45 + 175 * t_ticks / 65535  # 2^16 - 1 = 65535
-    rh_pRH = -6 + 125 * rh_ticks / 65535
-    if (rh_pRH > 100):
-        rh_pRH = 100
-    if (rh_pRH < 0):
-        rh_pRH = 0
-    # print('> temperature:', t_degC)
-    # print('> humidity:', rh_pRH)
-    return t_degC, rh_pRH
-
+    global render_us
 
-##=============================================================================
-def set_clock(timestamp=None):
-    '''
-    Update the display readings.
-    '''
     ##-------------------------------------------------------------------------
-    ## Assemble raw time and sensor strings
+    ## Get local time and sensor readings
     if not timestamp:
-        timestamp = ts_clocktick
+        timestamp = clock.time()
 
-    localtime = datetime_util.cettime(timestamp)
+    localtime = timezone.localtime(timestamp)
     # if len(localtime) == 8:
     #     ## MicroPython
     #     year, month, mday, hour, minute, second, weekday, yearday = localtime
@@ -204,9 +202,9 @@ def set_clock(timestamp=None):
     #     ## CPython
     #     year, month, mday, hour, minute, second, weekday, yearday, dst = localtime
     hour, minute, second = localtime[3:6]
-    try:
-        temp, hum = read_sensor()
-    except Exception:
+    ## Latest reading of the sensor task, see sht40_util.Sampler
+    temp, hum, _, stale = sensor.latest()
+    if stale:
         temp, hum = None, None
 
     ## DEBUG
@@ -223,205 +221,241 @@ def set_clock(timestamp=None):
     # elif second // 10 == 5:
     #     temp, hum = None, None
 
-    time_str = "{:02d}:{:02d}.{:02d}".format(hour, minute, second)
-    try:
-        sensor_str = "{:4.1f}C {:4.1f}%".format(temp, hum)
-    except ValueError:
-        sensor_str = '----  ----'
-    print("{} / {}".format(time_str, sensor_str))
-
     ##-------------------------------------------------------------------------
     ## Use darkmode during night time
-    ## TODO: handle darkmode
     # if hour in [20,21,22,23,0,1,2,3,4,5,6]:
     #     darkmode = True
     # else:
     #     darkmode = False
-    big = big_yellow
-    small = small_yellow
+    if night.update(hour):
+        set_darkmode(night.active)
+    color = night.color(color)
 
     ##-------------------------------------------------------------------------
-    ## Assemble character images lists per line
-    time_display = []
-    sensor_display = []
-    ## Time HH:MM in big chars
-    for char in time_str[:-3]:
-        time_display.append(big[char])
-    ## Time .SS in small chars
-    for char in time_str[-3:]:
-        time_display.append(small[char])
-    ## Sensor data in small chars
-    for char in sensor_str:
-        sensor_display.append(small[char])
+    ## Draw into the back buffer and show it from the next frame on
+    t_start = time.ticks_us()
+    time_str, sensor_str = face.render(frames.back, hour, minute, second, temp, hum, color)
+    frames.publish()
+    render_us = time.ticks_diff(time.ticks_us(), t_start)
+    print("{} / {} ({}us)".format(time_str, sensor_str, render_us))
+    if render_us > render_budget_us:
+        print("!! clock face update exceeded budget of {}us".format(render_budget_us))
+    if debug_mode:
+        print("line cache: {} hits / {} misses".format(face.cache.hits, face.cache.misses))
+        print("frames: {} published / {} shown".format(frames.generation, frames.shown))
 
-    ##-------------------------------------------------------------------------
-    ## Concatenate character arrays and center on screen
-    matrix.clear_dirty_bytes()
-    # matrix.clear_all_bytes()
-
-    ## Default character spacings
-    space_big = 2    # default spacing for 'big'
-    space_small = 1  # default spacing for 'small'
-
-    ## 1) pixels(HH:MM)    = 2*8(+4) + 2(+2) + 2*8(+2) = 42
-    ## 2) pixels(HH:MM.SS) = 42(+2) + 1+2*5(+2)        = 57
-    # => 1st column index is ((64 - pixels) / 2) =
-    ## 1) : 11
-    ## 2) :  3.5
-    ## TODO: Show full timestamp when flickerfree, see async def _set_clock()
-    col = 4   # HH:MM.ss
-    col = 11  # HH:MM
-    for img in time_display[:-3]:
-        matrix.set_pixels(5, col, img)
-        col += len(img[0]) + space_big
-    # for img in time_display[-3:]:
-    #     matrix.set_pixels(5, col, img)
-    #     col += len(img[0]) + space_small
-
-    ## 1) pixels('xx.xC xx.x%') = 5+5+1+5+6(+5) + [5](+1) + 5+5+1+5+5(+4) = 58
-    ## 2) pixels('-x.xC xx.x%') = 4+5+1+5+6(+5) + [5](+1) + 5+5+1+5+5(+4) = 57
-    ## 3) pixels('-xx.xC xx.x%') = 4(+1) + 58                             = 63
-    ## 4) pixels('----  ----') = 8*4 + 2*5 (+9)                           = 51
-    ## => 1st column index is ((64 - pixels) / 2) =
-    ## 1) :  3
-    ## 2) :  3.5
-    ## 3) :  0.5
-    ## 4) :  6.5
-    if len(sensor_str) == 11 and temp >= 0:
-        col = 3
-    if len(sensor_str) == 11 and temp < 0:
-        col = 4
-    elif len(sensor_str) == 12:
-        col = 1
-    elif len(sensor_str) == 10:
-        col = 7
-    for img in sensor_display:
-        matrix.set_pixels(22, col, img)
-        col += len(img[0]) + space_small
+
+##-----------------------------------------------------------------------------
+def set_darkmode(active):
+    '''
+    Switch the refresh rate and illumination time for darkmode.
+
+    The refresh loops sleep for the rest of each frame period, i.e. the time
+    freed goes to idle.
+    '''
+    global refresh_period_ms
+
+    if active:
+        refresh_period_ms = 1000 // night.refresh_rate
+        config.illumination_time_microseconds = night.illumination_time_us
+    else:
+        refresh_period_ms = 0
+        config.illumination_time_microseconds = illumination_time_us
+    if scanner is not None:
+        if active:
+            scanner.set_rate(night.refresh_rate, night.illumination_time_us)
+        else:
+            scanner.set_rate(scan_rate)
+    print(">> darkmode {}".format('on' if active else 'off'))
 
 
 ##-----------------------------------------------------------------------------
-async def _set_clock(lock):
+async def _set_clock():
     '''
     Scheduler to update the display readings.
     '''
     while True:
-        print("{:02d}.{:02d}:{:02d}".format(*time.localtime(ts_clocktick)[3:6]))
-
-        ## TODO: update every second when when flickerfree
-        # if ts_clocktick % 30 == 0:  # 2023-06-30: update every 30secs
-        if ts_clocktick % 10 == 0:  # 2023-12-06: update every 10secs
-            await lock.acquire()
-            set_clock()
-            lock.release()
-        await asyncio.sleep(1)
+        ## wake up on the next update boundary, so the second flips on time,
+        ## or right after the clock has been set by an NTP sync
+        ## 2023-06-30: update every 30secs, 2023-12-06: update every 10secs
+        timestamp = await clock.wait_next(update_interval)
+        if clock.changed.is_set():
+            clock.changed.clear()
+        elif profiling:
+            ## ms past the boundary in clock time
+            hist_clock_lag.add(1000 * clock.now()[1] // clock.speed)
+
+        ## publishes a new frame, see framebuffer.DoubleBuffer
+        t_start = time.ticks_us()
+        await frames.wait_free()
+        if profiling:
+            hist_clock_wait.since(t_start)
+            t_start = time.ticks_us()
+        set_clock(timestamp)
+        if profiling:
+            hist_clock_run.since(t_start)
 
 
 ##=============================================================================
-def sync_time_NTP():
+async def sync_time_NTP():
     '''
-    Synchronize via NTP.
+    Synchronize via NTP, without blocking the event loop, see ntp_util.
+
+    Returns
+    -------
+    sample : tuple
+        See ntp_util.query(), None if the synchronization failed.
     '''
     try:
         print('\n>> syncing with NTP ...')
         ## check connection status, and (re-)connect if required
         wlan_util.connect()
-
-        ## get time
-        # print('<< NTP timestamp:', ntptime.time())
-        ## set time
-        ntptime.settime()
-        print('<< NTP timestamp:', time.time())
-        return True
-
+        if len(ntp_addrs) < len(ntp_hosts):
+            ntp_addrs.clear()
+            for host in ntp_hosts:
+                try:
+                    ntp_addrs.append(ntp_util.resolve(host))
+                except OSError:
+                    print('!! could not resolve {}'.format(host))
     except Exception:
         print('!! NTP synchronization failed!')
-        return False
+        return None
+    if not ntp_addrs:
+        print('!! NTP synchronization failed!')
+        return None
+
+    ## 5 attempts with timeouts and backoff, all servers concurrently
+    sample = await ntp_util.sync(ntp_addrs, 5, ntp_timeout, ntp_backoff,
+                                 rounds=ntp_rounds, quorum=ntp_quorum)
+    if sample is None:
+        print('!! NTP synchronization failed!')
+        ## resolve the hosts again on the next attempt
+        ntp_addrs.clear()
+    else:
+        print('<< NTP timestamp: {}.{:03d} (delay {}ms)'.format(*sample[:3]))
+    return sample
 
 
 ##-----------------------------------------------------------------------------
-async def _sync_time_NTP(lock):
+async def _sync_time_NTP():
     '''
     Scheduler to synchronize via NTP.
     '''
-    global ts_clocktick
     global ts_ntpsync
 
     while True:
-        if (ts_ntpsync == 0) or (ts_clocktick - ts_ntpsync > ntp_interval):
-            await lock.acquire()
-            for _ in range(5):
-                if sync_time_NTP():
-                    ts_clocktick = time.time()
-                    ts_ntpsync = ts_clocktick
-                    #print(datetime_util.cettime(ts_clocktick))
+        t_start = time.ticks_us()
+        sample = await sync_time_NTP()
+        if profiling:
+            hist_ntp_run.since(t_start)
+        if sample is not None:
+            seconds, ms, delay_ms, ticks = sample
+            ## slews out small offsets, steps large ones, which wakes up
+            ## _set_clock() to update the clock immediately
+            offset_ms = clock.adjust(seconds, ms, ticks)
+            ts_ntpsync = seconds
+            print('<< offset {}ms, drift {:.2f}ppm, next sync in {}s'.format(offset_ms, clock.drift_ppm, clock.sync_interval))
+
+        ## sleep until the next sync is due
+        await asyncio.sleep(clock.sync_interval if sample is not None else ntp_retry_interval)
 
-                    ## update clock immediately after NTP sync
-                    set_clock()
-                    break
-            lock.release()
 
-        await asyncio.sleep(5)
+##-----------------------------------------------------------------------------
+async def _refresh_display():
+    '''
+    Scheduler to show/refresh the display.
+    '''
+    while True:
+        ## never waits for the renderer, see framebuffer.DoubleBuffer
+        t_start = time.ticks_ms()
+        display.display_data()
+        if refresh_period_ms:
+            ## darkmode: idle for the rest of the frame period
+            await asyncio.sleep_ms(max(0, refresh_period_ms - time.ticks_diff(time.ticks_ms(), t_start)))
+        else:
+            await asyncio.sleep(0)
 
 
 ##-----------------------------------------------------------------------------
-async def _refresh_display(lock):
+def _refresh_display_thread():
     '''
-    Scheduler to show/refresh the display.
+    Thread to show/refresh the display, independent of the event loop.
     '''
     while True:
-        await lock.acquire()
-        hub75spi.display_data()
-        lock.release()
-        await asyncio.sleep(0)
+        t_start = time.ticks_ms()
+        display.display_data()
+        if refresh_period_ms:
+            ## darkmode: idle for the rest of the frame period
+            time.sleep_ms(max(0, refresh_period_ms - time.ticks_diff(time.ticks_ms(), t_start)))
 
 
 ##-----------------------------------------------------------------------------
-def _clocktick(timer):
+async def _dump_profile():
     '''
-    Timed function to add one second.
+    Scheduler to print the profiling statistics.
     '''
-    global ts_clocktick
+    while True:
+        await asyncio.sleep(profile_dump_interval)
+        prof.dump()
+        print(display)
 
-    ts_clocktick += 1
+
+##-----------------------------------------------------------------------------
+async def _report_refresh_rate():
+    '''
+    Scheduler to report the achieved refresh rate.
+    '''
+    while True:
+        frames_start = frames.frames
+        t_start = time.ticks_ms()
+        await asyncio.sleep(refresh_report_interval)
+        dt = time.ticks_diff(time.ticks_ms(), t_start)
+        print(">> refresh rate ({}): {:.1f} Hz".format(refresh_mode, framebuffer.frames_diff(frames.frames, frames_start) * 1000 / dt))
 
 
 ##=============================================================================
 async def main():
+    global scanner
+
     ##-------------------------------------------------------------------------
     ## show Python Logo
     matrix.set_pixels(0, 16, logo)
     for _ in range(100):
         hub75spi.display_data()
+    frames.clear_all_bytes()
 
     ##-------------------------------------------------------------------------
     ## init WiFi
     wlan_util.init()
 
-    ##-------------------------------------------------------------------------
-    ## init timer
-    ## https://docs.micropython.org/en/latest/esp8266/quickref.html#timers
-    ## https://docs.micropython.org/en/latest/esp32/quickref.html#timers
-    tim = Timer(0)
-    if not debug_mode:
-        period = 1000
-    else:
-        ## run 5x faster
-        period = 200
-    tim.init(period=period, mode=Timer.PERIODIC, callback=_clocktick)
-
-    ##-------------------------------------------------------------------------
-    ## create the Lock instance
-    lock = asyncio.Lock()
-
     ##-------------------------------------------------------------------------
     ## create co-routines (cooperative tasks)
-    asyncio.create_task(_set_clock(lock))
-    asyncio.create_task(_refresh_display(lock))
-    asyncio.create_task(_sync_time_NTP(lock))
-
-    while True:
-        await asyncio.sleep(0)
+    ## no lock needed, frames are handed over by framebuffer.DoubleBuffer
+    tasks = [asyncio.create_task(_set_clock())]
+    if refresh_mode == 'thread':
+        _thread.start_new_thread(_refresh_display_thread, ())
+    elif refresh_mode == 'timer':
+        ## takes over the pins from hub75spi
+        if night.active:
+            scanner = rowscan.RowScanner(frames, config, night.refresh_rate, night.illumination_time_us)
+        else:
+            scanner = rowscan.RowScanner(frames, config, scan_rate)
+        scanner.start()
+        tasks.append(asyncio.create_task(scanner.run()))
+    else:
+        tasks.append(asyncio.create_task(_refresh_display()))
+    tasks.append(asyncio.create_task(_report_refresh_rate()))
+    tasks.append(asyncio.create_task(_sync_time_NTP()))
+    tasks.append(asyncio.create_task(sensor.run()))
+    if profiling:
+        tasks.append(asyncio.create_task(profile_util.watch_loop(hist_loop_lag)))
+        if profile_dump_interval:
+            tasks.append(asyncio.create_task(_dump_profile()))
+
+    ## all tasks sleep until their deadline or event, idle time goes to the
+    ## display refresh. Not gathered, so a failing task does not stop the
+    ## others
+    await asyncio.Event().wait()
 
 try:
     asyncio.run(main())
@@ -0,0 +1,311 @@
+# -*- coding: utf-8 -*-
+
+"""
+Non-blocking SNTP client for uasyncio.
+
+Unlike ntptime.settime(), the UDP round-trip never blocks the event loop:
+the socket is non-blocking and polled between short sleeps. Only resolving
+the host name blocks, so the address is resolved once and kept.
+
+Several servers are queried concurrently, and the sample with the lowest
+delay among the servers agreeing on the time is used, see best().
+
+Test against a local stand-in server, see tools/sntp_server.py.
+
+@author: mada
+@version: 2026-10-17
+"""
+
+import random
+import struct
+
+try:
+    import usocket as socket
+    import uasyncio as asyncio
+except ModuleNotFoundError:
+    import socket
+    import asyncio
+
+import datetime_util
+from ticks_util import ticks_ms, ticks_diff
+
+##*****************************************************************************
+##*****************************************************************************
+
+## (li_vn_mode, stratum, poll, precision, root delay, root dispersion, ref id,
+##  reference, originate, receive and transmit timestamp as seconds/fraction)
+PACKET = '!BBbb11I'
+PACKET_SIZE = 48
+VERSION = 4
+MODE_CLIENT = 3
+MODE_SERVER = 4
+
+## Seconds from the NTP epoch 1900-01-01 to the epoch of time.time()
+NTP_DELTA = 2208988800 + datetime_util.EPOCH_DAYS * datetime_util.DAY
+
+## Interval between two polls of the socket
+POLL_INTERVAL = 0.01  # seconds
+
+##*****************************************************************************
+##*****************************************************************************
+
+
+##=============================================================================
+def resolve(host, port=123):
+    '''
+    Resolve the server address, blocking.
+    '''
+    return socket.getaddrinfo(host, port, 0, socket.SOCK_DGRAM)[0][-1]
+
+
+##=============================================================================
+def _ms(seconds, fraction):
+    '''
+    Convert an NTP timestamp to milliseconds since the epoch of time.time().
+    '''
+    return (seconds - NTP_DELTA) * 1000 + (fraction * 1000 >> 32)
+
+
+##=============================================================================
+def request(cookie):
+    '''
+    Build a client request, the cookie is sent as transmit timestamp and has
+    to come back as originate timestamp.
+    '''
+    return struct.pack(PACKET, VERSION << 3 | MODE_CLIENT, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, cookie[0], cookie[1])
+
+
+##=============================================================================
+def parse(packet, cookie, rtt_ms):
+    '''
+    Check a server reply and compute the server time.
+
+    Parameters
+    ----------
+    packet : bytes
+    cookie : tuple
+        Transmit timestamp of the request.
+    rtt_ms : int
+        Round-trip time measured by the client.
+
+    Returns
+    -------
+    ms : int
+        Server time at the reception of the reply, in ms since the epoch.
+    delay_ms : int
+        Network delay, i.e. the round-trip time without the server time.
+    '''
+    if len(packet) < PACKET_SIZE:
+        raise ValueError("short NTP packet")
+    fields = struct.unpack(PACKET, packet[:PACKET_SIZE])
+    li_vn_mode, stratum = fields[0], fields[1]
+    if li_vn_mode & 0x07 != MODE_SERVER:
+        raise ValueError("no NTP server reply")
+    if li_vn_mode >> 6 == 3 or not 1 <= stratum <= 15:
+        ## unsynchronized or kiss-of-death
+        raise ValueError("NTP server not synchronized")
+    if (fields[9], fields[10]) != tuple(cookie):
+        raise ValueError("NTP reply does not match the request")
+    if not fields[13]:
+        raise ValueError("no NTP transmit timestamp")
+
+    receive = _ms(fields[11], fields[12])
+    transmit = _ms(fields[13], fields[14])
+    delay_ms = max(0, rtt_ms - (transmit - receive))
+    return transmit + delay_ms // 2, delay_ms
+
+
+##=============================================================================
+async def query(addr, timeout=1):
+    '''
+    Query an NTP server once.
+
+    Parameters
+    ----------
+    addr : tuple
+        Server address, see resolve().
+    timeout : float, optional
+        Seconds to wait for the reply.
+
+    Returns
+    -------
+    seconds : int
+        Server time in seconds since the epoch of time.time() ...
+    ms : int
+        ... plus milliseconds, at `ticks`.
+    delay_ms : int
+        Network delay.
+    ticks : int
+        ticks_ms() at the reception of the reply.
+
+    Raises
+    ------
+    asyncio.TimeoutError
+        No valid reply within the timeout.
+    '''
+    cookie = (random.getrandbits(32), random.getrandbits(32))
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    try:
+        sock.setblocking(False)
+        t_send = ticks_ms()
+        sock.sendto(request(cookie), addr)
+        while True:
+            try:
+                packet = sock.recv(PACKET_SIZE)
+            except OSError:
+                ## nothing received yet, EAGAIN
+                if ticks_diff(ticks_ms(), t_send) > timeout * 1000:
+                    raise asyncio.TimeoutError
+                await asyncio.sleep(POLL_INTERVAL)
+                continue
+            ticks = ticks_ms()
+            try:
+                ms, delay_ms = parse(packet, cookie, ticks_diff(ticks, t_send))
+            except ValueError:
+                ## e.g. a late reply to an earlier request, keep waiting
+                continue
+            return ms // 1000, ms % 1000, delay_ms, ticks
+    finally:
+        sock.close()
+
+
+##=============================================================================
+def _time_at(sample, ticks):
+    '''
+    Server time of a sample extrapolated to ticks_ms() `ticks`, in ms.
+    '''
+    seconds, ms, delay_ms, sample_ticks = sample
+    return seconds * 1000 + ms + ticks_diff(ticks, sample_ticks)
+
+
+##=============================================================================
+def select(samples, quorum=1, tolerance_ms=100):
+    '''
+    Pick the best of the samples of several servers.
+
+    Each server is represented by its sample with the lowest delay, the
+    latest on ties. Two servers agree if their times differ by at most
+    `tolerance_ms` plus their delays. The largest group of servers agreeing
+    with one server is kept, the others are outliers, e.g. servers with a
+    wrong time. Of the group, the sample with the lowest delay wins.
+
+    Parameters
+    ----------
+    samples : list
+        Tuples (server, sample), see query() for the sample.
+    quorum : int, optional
+        Minimum number of servers agreeing.
+    tolerance_ms : int, optional
+
+    Returns
+    -------
+    sample : tuple
+        None if less than `quorum` servers agree.
+    '''
+    best = {}
+    for server, sample in samples:
+        if server not in best or sample[2] <= best[server][2]:
+            best[server] = sample
+    if len(best) < quorum:
+        return None
+
+    ticks = ticks_ms()
+    times = [(_time_at(sample, ticks), sample) for sample in best.values()]
+    agreeing = []
+    for time_ms, sample in times:
+        group = [other for other_ms, other in times
+                 if abs(other_ms - time_ms) <= tolerance_ms + sample[2] + other[2]]
+        if len(group) > len(agreeing):
+            agreeing = group
+    if len(agreeing) < quorum:
+        return None
+    return min(agreeing, key=lambda sample: sample[2])
+
+
+##=============================================================================
+async def best(addrs, rounds=3, timeout=1, quorum=2, good_delay_ms=50, tolerance_ms=100):
+    '''
+    Query several NTP servers concurrently, `rounds` times each, and pick the
+    best sample, see select().
+
+    Returns as soon as `quorum` servers agree on a sample with a delay of at
+    most `good_delay_ms`, without waiting for the slower servers.
+
+    Parameters
+    ----------
+    addrs : list
+        Server addresses, see resolve().
+    rounds : int, optional
+        Queries per server.
+    timeout : float, optional
+        Seconds to wait for each reply.
+    quorum : int, optional
+        Minimum number of servers agreeing, at most the number of servers.
+    good_delay_ms : int, optional
+    tolerance_ms : int, optional
+
+    Returns
+    -------
+    sample : tuple
+        See query(), None if no servers agree.
+    '''
+    quorum = min(quorum, len(addrs))
+    samples = []
+    received = asyncio.Event()
+    done = [0]
+
+    async def poll(server, addr):
+        try:
+            for _ in range(rounds):
+                try:
+                    samples.append((server, await query(addr, timeout)))
+                except (OSError, asyncio.TimeoutError):
+                    continue
+                received.set()
+        finally:
+            done[0] += 1
+            received.set()
+
+    tasks = [asyncio.create_task(poll(server, addr)) for server, addr in enumerate(addrs)]
+    try:
+        while done[0] < len(tasks):
+            await received.wait()
+            received.clear()
+            sample = select(samples, quorum, tolerance_ms)
+            if sample is not None and sample[2] <= good_delay_ms:
+                return sample
+        return select(samples, quorum, tolerance_ms)
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
+##=============================================================================
+async def sync(addrs, attempts=5, timeout=1, backoff=1, **kwargs):
+    '''
+    Query NTP servers, retrying with exponential backoff.
+
+    Parameters
+    ----------
+    addrs : list
+        Server addresses, see resolve().
+    attempts : int, optional
+    timeout : float, optional
+        Seconds to wait for each reply.
+    backoff : float, optional
+        Seconds to wait before the first retry, doubled for every retry.
+    kwargs
+        Passed on to best().
+
+    Returns
+    -------
+    sample : tuple
+        See query(), None if all attempts failed.
+    '''
+    for attempt in range(attempts):
+        sample = await best(addrs, timeout=timeout, **kwargs)
+        if sample is not None:
+            return sample
+        if attempt < attempts - 1:
+            await asyncio.sleep(backoff * (1 << attempt))
+    return None
@@ -0,0 +1,263 @@
+# -*- coding: utf-8 -*-
+
+"""
+Lightweight run time statistics of the cooperative tasks.
+
+The bin counters are preallocated, so recording a duration takes a few
+microseconds only. The statistics are printed with Profiler.dump(), e.g.
+from the REPL after interrupting main.py.
+
+@author: mada
+@version: 2026-10-17
+"""
+
+from array import array
+
+try:
+    import uasyncio as asyncio
+except ModuleNotFoundError:
+    import asyncio
+
+from ticks_util import ticks_us, ticks_diff
+
+##*****************************************************************************
+##*****************************************************************************
+
+## Limit of the total of a histogram, a duration from ticks_diff() is below
+## as well, so the sum of both stays below the small int limit 2**30
+TOTAL_LIMIT = 1 << 29
+
+##*****************************************************************************
+##*****************************************************************************
+
+
+##=============================================================================
+class Histogram():
+    '''
+    Durations in µs, counted in power-of-two bins.
+
+    Bin 0 counts durations below 2**shift µs, bin i below 2**(shift + i) µs,
+    and the last bin everything above.
+
+    The counters stay small ints, so adding never allocates: when the total
+    reaches TOTAL_LIMIT, the bins, the count and the total are halved. The
+    mean and the percentiles then weigh the recent durations more.
+    '''
+    def __init__(self, name, bins=16, shift=6):
+        '''
+        Parameters
+        ----------
+        name : str
+        bins : int, optional
+            Number of bins.
+        shift : int, optional
+            Upper bound of bin 0 as power of two, 6 is 64µs.
+        '''
+        self.name = name
+        self.shift = shift
+        self.counts = array('I', bytes(4 * bins))
+        self.reset()
+
+    def reset(self):
+        for i in range(len(self.counts)):
+            self.counts[i] = 0
+        self.count = 0
+        self.total = 0
+        self.max = 0
+
+    def add(self, us):
+        '''
+        Count a duration in µs.
+        '''
+        last = len(self.counts) - 1
+        i = 0
+        us_shifted = us >> self.shift
+        while us_shifted and i < last:
+            us_shifted >>= 1
+            i += 1
+        self.counts[i] += 1
+        self.count += 1
+        self.total += us
+        if us > self.max:
+            self.max = us
+        if self.total >= TOTAL_LIMIT or self.count >= TOTAL_LIMIT:
+            self._halve()
+
+    def _halve(self):
+        for i in range(len(self.counts)):
+            self.counts[i] >>= 1
+        self.count >>= 1
+        self.total >>= 1
+
+    def since(self, t_start):
+        '''
+        Count the duration since ticks_us() `t_start`.
+        '''
+        self.add(ticks_diff(ticks_us(), t_start))
+
+    def percentile(self, p):
+        '''
+        Return the upper bound in µs of the bin holding the p-th percentile,
+        the maximum for the last bin.
+        '''
+        rank = self.count * p / 100
+        n = 0
+        for i, count in enumerate(self.counts):
+            n += count
+            if count and n >= rank:
+                if i == len(self.counts) - 1:
+                    return self.max
+                return 1 << (self.shift + i)
+        return 0
+
+    def __str__(self):
+        if not self.count:
+            return "{}: -".format(self.name)
+        return "{}: n={} mean={}us p50<{}us p99<{}us max={}us".format(
+            self.name, self.count, self.total // self.count, self.percentile(50), self.percentile(99), self.max)
+
+
+##=============================================================================
+class Profiler():
+    '''
+    Named histograms, created once at startup.
+    '''
+    def __init__(self, bins=16, shift=6):
+        self.bins = bins
+        self.shift = shift
+        self.histograms = {}
+
+    def histogram(self, name):
+        '''
+        Return the histogram of that name, creating it on first use.
+        '''
+        try:
+            return self.histograms[name]
+        except KeyError:
+            hist = Histogram(name, self.bins, self.shift)
+            self.histograms[name] = hist
+            return hist
+
+    def reset(self):
+        for hist in self.histograms.values():
+            hist.reset()
+
+    def dump(self, bins=False):
+        '''
+        Print all histograms, optionally with the counts per bin.
+        '''
+        for name in sorted(self.histograms):
+            hist = self.histograms[name]
+            print(hist)
+            if bins and hist.count:
+                last = len(hist.counts) - 1
+                print("    " + " ".join("{}{}:{}".format('>=' if i == last else '<', 1 << (hist.shift + min(i, last - 1)), count)
+                                        for i, count in enumerate(hist.counts) if count))
+
+
+##=============================================================================
+async def watch_loop(hist, period=0.1):
+    '''
+    Task to record the event loop lag, i.e. how late a sleep of `period`
+    seconds returns.
+    '''
+    period_us = int(period * 1000000)
+    while True:
+        t_start = ticks_us()
+        await asyncio.sleep(period)
+        hist.add(max(0, ticks_diff(ticks_us(), t_start) - period_us))
+
+
+##=============================================================================
+class FrameProfiler():
+    '''
+    Wrapper of display_data() recording the frame times of the last frames.
+
+    Frame durations and the gaps between the starts of two frames are kept in
+    ring buffers of `size` frames. Works with hub75.Hub75Spi on the device as
+    well as with the simulated one, or any other object with display_data().
+    '''
+    def __init__(self, display, size=256, run_hist=None, gap_hist=None):
+        '''
+        Parameters
+        ----------
+        display : hub75.Hub75Spi or framebuffer.DoubleBuffer
+        size : int, optional
+            Number of frames kept.
+        run_hist, gap_hist : Histogram, optional
+            Histograms to count the frame durations and gaps into as well.
+        '''
+        self.display = display
+        self.size = size
+        self.run_hist = run_hist
+        self.gap_hist = gap_hist
+        self.count = 0  # frames so far, wrapped below 2 * size to stay a small int
+        self._durations = array('i', bytes(4 * size))
+        self._gaps = array('i', bytes(4 * size))
+        self._t_last = 0
+
+    def reset(self):
+        self.count = 0
+
+    def display_data(self):
+        '''
+        Scan out one frame via the wrapped display_data().
+        '''
+        t_start = ticks_us()
+        self.display.display_data()
+        duration = ticks_diff(ticks_us(), t_start)
+        i = self.count % self.size
+        self._durations[i] = duration
+        ## the gap of the first frame is unknown
+        gap = ticks_diff(t_start, self._t_last) if self.count else 0
+        self._gaps[i] = gap
+        self._t_last = t_start
+        self.count += 1
+        if self.count >= 2 * self.size:
+            self.count -= self.size
+        if self.run_hist is not None:
+            self.run_hist.add(duration)
+        if self.gap_hist is not None and gap:
+            self.gap_hist.add(gap)
+
+    def stats(self):
+        '''
+        Compute the statistics of the buffered frames.
+
+        Returns
+        -------
+        stats : dict
+            frames, rate_hz (effective refresh rate), duration_mean_us,
+            duration_max_us, gap_p50_us, gap_p95_us, gap_p99_us, gap_max_us
+            (worst gap) and jitter_us (p99 - p50 of the gaps), None if there
+            are less than two frames.
+        '''
+        n = min(self.count, self.size)
+        durations = sorted(self._durations[:n])
+        ## gaps of the buffered frames, except for the very first frame
+        gaps = sorted(self._gaps[i] for i in range(n) if self.count > self.size or i > 0)
+        if not gaps:
+            return None
+
+        def percentile(p):
+            return gaps[min(len(gaps) - 1, len(gaps) * p // 100)]
+
+        return {
+            'frames': n,
+            'rate_hz': 1000000 * len(gaps) / sum(gaps) if sum(gaps) else 0,
+            'duration_mean_us': sum(durations) // n,
+            'duration_max_us': durations[-1],
+            'gap_p50_us': percentile(50),
+            'gap_p95_us': percentile(95),
+            'gap_p99_us': percentile(99),
+            'gap_max_us': gaps[-1],
+            'jitter_us': percentile(99) - percentile(50),
+            }
+
+    def __str__(self):
+        stats = self.stats()
+        if stats is None:
+            return "frames: -"
+        return ("frames: n={frames} rate={rate_hz:.1f}Hz duration mean={duration_mean_us}us max={duration_max_us}us"
+                " gap p50={gap_p50_us}us p95={gap_p95_us}us p99={gap_p99_us}us max={gap_max_us}us"
+                " jitter={jitter_us}us").format(**stats)
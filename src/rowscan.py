@@ -0,0 +1,230 @@
+# -*- coding: utf-8 -*-
+
+"""
+Timer driven row scanning of the HUB75 panel at a constant refresh rate.
+
+A machine.Timer callback shifts out one row pair per tick from precomputed
+GPIO masks, so the refresh rate does not depend on the load of the event
+loop. Only 3-bit RGB colors are shown, like the clock face uses them.
+
+ESP32 only: the pins are written via the GPIO set/clear registers.
+
+@author: mada
+@version: 2026-10-17
+"""
+
+from array import array
+
+import micropython
+from machine import Pin
+from machine import Timer
+from machine import mem32
+
+import uasyncio as asyncio
+import utime as time
+
+##*****************************************************************************
+##*****************************************************************************
+
+## ESP32 GPIO output set/clear registers for GPIO0..31 and GPIO32..39
+GPIO_OUT_W1TS = 0x3FF44008
+GPIO_OUT_W1TC = 0x3FF4400C
+GPIO_OUT1_W1TS = 0x3FF44014
+GPIO_OUT1_W1TC = 0x3FF44018
+
+##*****************************************************************************
+##*****************************************************************************
+
+
+##=============================================================================
+def _masks(pin_numbers):
+    '''
+    Split pin numbers into the register masks of GPIO0..31 and GPIO32..39.
+    '''
+    lo = 0
+    hi = 0
+    for n in pin_numbers:
+        if n < 32:
+            lo |= 1 << n
+        else:
+            hi |= 1 << (n - 32)
+    return lo, hi
+
+
+##=============================================================================
+class RowScanner():
+    '''
+    Scan-out of a framebuffer.DoubleBuffer from a timer interrupt.
+
+    Each tick shifts out one row pair (row n and n + rows/2), latches it and
+    leaves it lit until the next tick, i.e. a frame takes rows/2 ticks. With
+    an illumination time, the row pair is blanked after that time instead,
+    which dims the panel, e.g. for darkmode.
+
+    The published frames are converted into a row buffer of GPIO masks by
+    run(), outside of the interrupt. The callback switches to a new row buffer
+    at the start of a frame only, so frames never tear.
+
+    Takes over the pins from hub75.Hub75Spi, which must not be used anymore
+    once the scanner has been started.
+    '''
+    def __init__(self, frames, config, rate=100, illumination_us=None, timer=1):
+        '''
+        Parameters
+        ----------
+        frames : framebuffer.DoubleBuffer
+        config : hub75.Hub75SpiConfiguration
+            Pin numbers.
+        rate : int, optional
+            Refresh rate in Hz.
+        illumination_us : int, optional
+            Time a row pair is lit per tick, None for the whole tick.
+        timer : int, optional
+            Hardware timer id.
+        '''
+        self.frames = frames
+        self.rate = rate
+        self.illumination_us = illumination_us
+        self.rows = frames.front.row_size // 2
+        self.cols = frames.front.col_size
+        self._timer = Timer(timer)
+
+        ## Color pins per half: (red, green, blue) of the upper and lower half
+        self._color_pins = (
+            (config.red1_pin_number, config.green1_pin_number, config.blue1_pin_number),
+            (config.red2_pin_number, config.green2_pin_number, config.blue2_pin_number),
+            )
+        select_pins = (
+            config.line_select_a_pin_number,
+            config.line_select_b_pin_number,
+            config.line_select_c_pin_number,
+            config.line_select_d_pin_number,
+            config.line_select_e_pin_number,
+            )
+        for n in self._color_pins[0] + self._color_pins[1] + select_pins:
+            Pin(n, Pin.OUT, value=0)
+        Pin(config.clock_pin_number, Pin.OUT, value=0)
+        Pin(config.latch_pin_number, Pin.OUT, value=0)
+        Pin(config.output_enable_pin_number, Pin.OUT, value=1)  # active low
+
+        ## 3-bit RGB color -> pin masks, per half
+        self._color_masks = tuple(tuple(_masks([pin for bit, pin in zip((4, 2, 1), pins) if color & bit])
+                                        for color in range(8))
+                                  for pins in self._color_pins)
+        self._color_lo, self._color_hi = _masks(self._color_pins[0] + self._color_pins[1])
+        self._clock = 1 << config.clock_pin_number
+        self._latch = 1 << config.latch_pin_number
+        self._output_enable = 1 << config.output_enable_pin_number
+        ## Row select set masks, cleared by the mask of all select pins
+        self._select_all = _masks(select_pins)[0]
+        self._select = array('I', [_masks([pin for bit, pin in enumerate(select_pins) if row >> bit & 1])[0]
+                                   for row in range(self.rows)])
+
+        ## Row buffers: set masks of GPIO0..31 and GPIO32..39 per column
+        size = 2 * self.rows * self.cols
+        self._front = array('I', bytes(4 * size))
+        self._back = array('I', bytes(4 * size))
+        self._ready = False  # back row buffer holds a new frame
+        self._row = 0
+
+    def pack(self, matrix, rows):
+        '''
+        Convert the pixels of a matrix into GPIO masks.
+
+        Parameters
+        ----------
+        matrix : matrixdata.MatrixData
+        rows : array
+            Row buffer, two masks per column.
+        '''
+        upper, lower = self._color_masks
+        for row in range(self.rows):
+            i = 2 * row * self.cols
+            for col in range(self.cols):
+                lo1, hi1 = upper[matrix.get_pixel_value(row, col)]
+                lo2, hi2 = lower[matrix.get_pixel_value(row + self.rows, col)]
+                rows[i] = lo1 | lo2
+                rows[i + 1] = hi1 | hi2
+                i += 2
+
+    @micropython.native
+    def _scan_row(self, timer):
+        row = self._row
+        if row == 0 and self._ready:
+            self._front, self._back = self._back, self._front
+            self._ready = False
+        rows = self._front
+        color_lo = self._color_lo | self._clock
+        color_hi = self._color_hi
+        clock = self._clock
+
+        ## Shift in the colors of the row pair
+        i = 2 * row * self.cols
+        end = i + 2 * self.cols
+        while i < end:
+            mem32[GPIO_OUT_W1TC] = color_lo
+            mem32[GPIO_OUT1_W1TC] = color_hi
+            mem32[GPIO_OUT_W1TS] = rows[i]
+            mem32[GPIO_OUT1_W1TS] = rows[i + 1]
+            mem32[GPIO_OUT_W1TS] = clock
+            i += 2
+        mem32[GPIO_OUT_W1TC] = clock
+
+        ## Latch and light the row pair until the next tick
+        mem32[GPIO_OUT_W1TS] = self._output_enable
+        mem32[GPIO_OUT_W1TS] = self._latch
+        mem32[GPIO_OUT_W1TC] = self._latch
+        mem32[GPIO_OUT_W1TC] = self._select_all
+        mem32[GPIO_OUT_W1TS] = self._select[row]
+        mem32[GPIO_OUT_W1TC] = self._output_enable
+        if self.illumination_us is not None:
+            ## a few µs at most, the callback runs as soft interrupt
+            time.sleep_us(self.illumination_us)
+            mem32[GPIO_OUT_W1TS] = self._output_enable
+
+        row += 1
+        if row == self.rows:
+            row = 0
+            ## wrapping, see framebuffer.FRAMES_MASK
+            self.frames.frames = (self.frames.frames + 1) & 0x3FFFFFFF
+        self._row = row
+
+    def start(self):
+        '''
+        Start scanning at `rate` frames per second.
+        '''
+        self.pack(self.frames.front, self._front)
+        self._timer.init(freq=self.rate * self.rows, mode=Timer.PERIODIC, callback=self._scan_row)
+
+    def set_rate(self, rate, illumination_us=None):
+        '''
+        Change the refresh rate and the illumination time while scanning,
+        e.g. for darkmode.
+        '''
+        self.illumination_us = illumination_us
+        self.rate = rate
+        self._timer.init(freq=self.rate * self.rows, mode=Timer.PERIODIC, callback=self._scan_row)
+
+    def stop(self):
+        '''
+        Stop scanning and turn the panel off.
+        '''
+        self._timer.deinit()
+        mem32[GPIO_OUT_W1TS] = self._output_enable
+
+    async def run(self):
+        '''
+        Task to hand published frames over to the interrupt.
+
+        Wakes up on publishing, swaps in the published frame and packs it into
+        the back row buffer, once the interrupt has taken the previous one.
+        '''
+        while True:
+            await self.frames.published.wait()
+            self.frames.published.clear()
+            ## the interrupt takes the row buffer within one frame
+            while self._ready:
+                await asyncio.sleep(1 / self.rate)
+            self.frames.swap()
+            self.pack(self.frames.front, self._back)
+            self._ready = True
@@ -0,0 +1,197 @@
+# -*- coding: utf-8 -*-
+
+"""
+Readout of the Sensirion SHT40 temperature/humidity sensor via I2C.
+
+@author: mada
+@version: 2026-10-17
+"""
+
+from array import array
+
+try:
+    import utime as time
+    import uasyncio as asyncio
+except ModuleNotFoundError:
+    import time
+    import asyncio
+
+from ticks_util import ticks_ms, ticks_diff
+
+##*****************************************************************************
+##*****************************************************************************
+
+'''
+_SHT4X_DEFAULT_ADDR = const(0x44)  # SHT4X I2C Address
+_SHT4X_READSERIAL = const(0x89)    # Read Out of Serial Register
+_SHT4X_SOFTRESET = const(0x94)     # Soft Reset
+'''
+## (name, command, description, conversion time in seconds)
+modes = (
+    ("SERIAL_NUMBER", 0x89, "Serial number", 0.01),
+    ("NOHEAT_HIGHPRECISION", 0xFD, "No heater, high precision", 0.01),
+    ("NOHEAT_MEDPRECISION", 0xF6, "No heater, med precision", 0.005),
+    ("NOHEAT_LOWPRECISION", 0xE0, "No heater, low precision", 0.002),
+    ("HIGHHEAT_1S", 0x39, "High heat, 1 second", 1.1),
+    ("HIGHHEAT_100MS", 0x32, "High heat, 0.1 second", 0.11),
+    ("MEDHEAT_1S", 0x2F, "Med heat, 1 second", 1.1),
+    ("MEDHEAT_100MS", 0x24, "Med heat, 0.1 second", 0.11),
+    ("LOWHEAT_1S", 0x1E, "Low heat, 1 second", 1.1),
+    ("LOWHEAT_100MS", 0x15, "Low heat, 0.1 second", 0.11),
+    )
+
+##*****************************************************************************
+##*****************************************************************************
+
+
+##=============================================================================
+def convert(rx_bytes):
+    '''
+    Convert the 6 bytes of a measurement to physical values.
+
+    Returns
+    -------
+    * t_degC : float
+    * rh_pRH : float
+    '''
+    # print('>', rx_bytes, len(rx_bytes))
+    t_ticks = rx_bytes[0] * 256 + rx_bytes[1]
+    rh_ticks = rx_bytes[3] * 256 + rx_bytes[4]
+    t_degC = -45 + 175 * t_ticks / 65535  # 2^16 - 1 = 65535
+    rh_pRH = -6 + 125 * rh_ticks / 65535
+    if (rh_pRH > 100):
+        rh_pRH = 100
+    if (rh_pRH < 0):
+        rh_pRH = 0
+    # print('> temperature:', t_degC)
+    # print('> humidity:', rh_pRH)
+    return t_degC, rh_pRH
+
+
+##=============================================================================
+def measure(i2c, addr, mode=modes[1]):
+    '''
+    Read measurement data, sleeping for the conversion time.
+
+    Parameters
+    ----------
+    i2c : machine.I2C
+    addr : int
+        I2C address of the sensor.
+    mode : tuple, optional
+        Measurement mode, defaults to NOHEAT_HIGHPRECISION.
+
+    Returns
+    -------
+    * t_degC : float
+    * rh_pRH : float
+    '''
+    i2c.writeto(addr, bytearray([mode[1]]))
+    time.sleep(mode[-1])
+    return convert(i2c.readfrom(addr, 6))
+
+
+##=============================================================================
+async def measure_async(i2c, addr, mode=modes[1]):
+    '''
+    Read measurement data, yielding to the other tasks during the conversion.
+
+    Same as measure(), but awaits the conversion time, which is up to 1.1s
+    for the heater modes.
+    '''
+    i2c.writeto(addr, bytearray([mode[1]]))
+    await asyncio.sleep(mode[-1])
+    return convert(i2c.readfrom(addr, 6))
+
+
+##=============================================================================
+class Sampler():
+    '''
+    Background measurements into a ring buffer of the latest readings.
+
+    run() is a task of its own, so readers only look up the cached values and
+    never wait for I2C. The buffers are allocated once.
+    '''
+    def __init__(self, i2c, addr, mode=modes[1], period=10, size=6, max_age=None):
+        '''
+        Parameters
+        ----------
+        i2c : machine.I2C
+        addr : int
+            I2C address of the sensor.
+        mode : tuple, optional
+            Measurement mode, defaults to NOHEAT_HIGHPRECISION.
+        period : float, optional
+            Seconds between two measurements.
+        size : int, optional
+            Number of readings kept.
+        max_age : float, optional
+            Seconds after which a reading is stale, defaults to 3 periods.
+        '''
+        self.i2c = i2c
+        self.addr = addr
+        self.mode = mode
+        self.period = period
+        self.max_age_ms = int(1000 * (max_age if max_age is not None else 3 * period))
+        self.size = size
+        self.count = 0  # readings so far
+        self.errors = 0
+        self._t_degC = array('f', bytes(4 * size))
+        self._rh_pRH = array('f', bytes(4 * size))
+        self._ticks = array('i', bytes(4 * size))
+
+    def _store(self, t_degC, rh_pRH):
+        i = self.count % self.size
+        self._t_degC[i] = t_degC
+        self._rh_pRH[i] = rh_pRH
+        ## ticks_ms() wraps below 2**30 on MicroPython, i.e. fits 'i'
+        self._ticks[i] = ticks_ms()
+        self.count += 1
+
+    def latest(self):
+        '''
+        Return the latest reading.
+
+        Returns
+        -------
+        t_degC : float
+            None before the first reading.
+        rh_pRH : float
+            None before the first reading.
+        ticks : int
+            ticks_ms() of the measurement.
+        stale : bool
+            True if there is no reading of the last `max_age` seconds.
+        '''
+        if not self.count:
+            return None, None, 0, True
+        i = (self.count - 1) % self.size
+        ticks = self._ticks[i]
+        stale = ticks_diff(ticks_ms(), ticks) > self.max_age_ms
+        return self._t_degC[i], self._rh_pRH[i], ticks, stale
+
+    def history(self):
+        '''
+        Return the buffered readings, oldest first.
+
+        Returns
+        -------
+        readings : list
+            Tuples (t_degC, rh_pRH, ticks).
+        '''
+        first = max(0, self.count - self.size)
+        return [(self._t_degC[n % self.size], self._rh_pRH[n % self.size], self._ticks[n % self.size])
+                for n in range(first, self.count)]
+
+    async def run(self):
+        '''
+        Task to measure every `period` seconds.
+        '''
+        while True:
+            t_start = ticks_ms()
+            try:
+                self._store(*(await measure_async(self.i2c, self.addr, self.mode)))
+            except Exception:
+                self.errors += 1
+            elapsed = ticks_diff(ticks_ms(), t_start) / 1000
+            await asyncio.sleep(max(0, self.period - elapsed))
@@ -0,0 +1,32 @@
+# -*- coding: utf-8 -*-
+
+"""
+Tick counters of utime, with a CPython fallback for the simulator, the
+benchmarks and the tools.
+
+The fallback wraps like MicroPython, so differences of ticks have to be
+computed with ticks_diff() on both.
+
+@author: mada
+@version: 2026-10-17
+"""
+
+try:
+    import utime as time
+except ModuleNotFoundError:
+    import time
+
+try:
+    ticks_ms = time.ticks_ms
+    ticks_us = time.ticks_us
+    ticks_diff = time.ticks_diff
+except AttributeError:
+    ## CPython, wrapping like MicroPython
+    def ticks_ms():
+        return int(time.monotonic() * 1000) & 0x3FFFFFFF
+
+    def ticks_us():
+        return int(time.monotonic() * 1000000) & 0x3FFFFFFF
+
+    def ticks_diff(ticks1, ticks2):
+        return ((ticks1 - ticks2 + 0x20000000) & 0x3FFFFFFF) - 0x20000000
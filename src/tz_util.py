@@ -0,0 +1,173 @@
+# -*- coding: utf-8 -*-
+
+"""
+Table-driven time zones with daylight saving time.
+
+A zone is given by its standard and daylight offsets and two transition
+rules, like the M-rules of POSIX TZ strings: the DST starts on the `week`th
+`weekday` of `month` (week 5 is the last one) at the local time `seconds`
+after midnight, in the local time before the change. E.g. Central Europe,
+"CET-1CEST,M3.5.0,M10.5.0/3":
+
+    CET = Zone(3600, 7200, (3, 5, SUNDAY, 7200), (10, 5, SUNDAY, 10800))
+
+The transitions of a year are computed once, and the offset valid between
+two transitions is cached, so looking up the offset of a timestamp costs a
+single comparison most of the time.
+
+@author: mada
+@version: 2026-10-17
+"""
+
+import datetime_util
+
+##*****************************************************************************
+##*****************************************************************************
+
+MONDAY = 0
+SUNDAY = 6
+LAST = 5  # week of the last weekday of a month
+
+EPOCH_DAYS = datetime_util.EPOCH_DAYS
+DAY = datetime_util.DAY
+
+##*****************************************************************************
+##*****************************************************************************
+
+
+##=============================================================================
+def _days(year, month, day):
+    '''
+    Days from the epoch of time.time() to a date.
+    '''
+    return datetime_util.days_from_civil(year, month, day) - EPOCH_DAYS
+
+
+##=============================================================================
+def _rule_day(year, month, week, weekday):
+    '''
+    Days from the epoch to the `week`th `weekday` of a month, see Zone.
+    '''
+    first = _days(year, month, 1)
+    ## 1970-01-01 is a Thursday
+    day = first + (weekday - (first + EPOCH_DAYS + 3)) % 7 + (week - 1) * 7
+    if week == LAST:
+        if month == 12:
+            next_first = _days(year + 1, 1, 1)
+        else:
+            next_first = _days(year, month + 1, 1)
+        while day >= next_first:
+            day -= 7
+    return day
+
+
+##=============================================================================
+class Zone():
+    '''
+    Time zone with optional daylight saving time.
+    '''
+    def __init__(self, std_offset, dst_offset=None, start=None, end=None):
+        '''
+        Parameters
+        ----------
+        std_offset : int
+            Standard time minus UTC, in seconds.
+        dst_offset : int, optional
+            Daylight saving time minus UTC, in seconds, None for no DST.
+        start, end : tuple, optional
+            Rules (month, week, weekday, seconds) of the changes to daylight
+            saving time and back, see the module docstring.
+        '''
+        self.std_offset = std_offset
+        self.dst_offset = dst_offset
+        self.start = start
+        self.end = end
+        self._years = {}  # year -> transitions, see transitions()
+        ## offset valid from timestamp `_from` until before `_until`
+        self._from = 0
+        self._until = 0
+        self._offset = std_offset
+
+    def transitions(self, year):
+        '''
+        Compute the transitions of a year, cached.
+
+        Returns
+        -------
+        transitions : tuple
+            Timestamps of the start and the end of daylight saving time.
+        '''
+        try:
+            return self._years[year]
+        except KeyError:
+            pass
+        month, week, weekday, seconds = self.start
+        start = _rule_day(year, month, week, weekday) * DAY + seconds - self.std_offset
+        month, week, weekday, seconds = self.end
+        end = _rule_day(year, month, week, weekday) * DAY + seconds - self.dst_offset
+        if len(self._years) > 4:
+            self._years.clear()
+        self._years[year] = (start, end)
+        return start, end
+
+    def _lookup(self, ts_utc):
+        '''
+        Find the offset at a timestamp and the period it is valid for.
+        '''
+        year = datetime_util.civil_from_days(int(ts_utc) // DAY + EPOCH_DAYS)[0]
+        start, end = self.transitions(year)
+        year_start = _days(year, 1, 1) * DAY
+        year_end = _days(year + 1, 1, 1) * DAY
+        if start < end:
+            ## northern hemisphere, DST in the middle of the year
+            periods = ((year_start, start, self.std_offset),
+                       (start, end, self.dst_offset),
+                       (end, year_end, self.std_offset))
+        else:
+            periods = ((year_start, end, self.dst_offset),
+                       (end, start, self.std_offset),
+                       (start, year_end, self.dst_offset))
+        for period in periods:
+            if ts_utc < period[1]:
+                break
+        self._from, self._until, self._offset = period
+
+    def offset(self, ts_utc):
+        '''
+        Return the offset of local time to UTC at a timestamp, in seconds.
+        '''
+        if self.dst_offset is None:
+            return self.std_offset
+        if not self._from <= ts_utc < self._until:
+            self._lookup(ts_utc)
+        return self._offset
+
+    def is_dst(self, ts_utc):
+        '''
+        Check whether daylight saving time applies at a timestamp.
+        '''
+        return self.dst_offset is not None and self.offset(ts_utc) == self.dst_offset
+
+    def localtime(self, ts_utc):
+        '''
+        Convert a timestamp to the local time tuple, like time.localtime(),
+        see datetime_util.timetuple().
+        '''
+        return datetime_util.timetuple(ts_utc + self.offset(ts_utc))
+
+
+##*****************************************************************************
+##*****************************************************************************
+
+UTC = Zone(0)
+## Europe, changing at 01:00 UTC
+WET = Zone(0, 3600, (3, LAST, SUNDAY, 3600), (10, LAST, SUNDAY, 7200))
+CET = Zone(3600, 7200, (3, LAST, SUNDAY, 7200), (10, LAST, SUNDAY, 10800))
+EET = Zone(7200, 10800, (3, LAST, SUNDAY, 10800), (10, LAST, SUNDAY, 14400))
+## North America, changing at 02:00 local time
+US_EASTERN = Zone(-18000, -14400, (3, 2, SUNDAY, 7200), (11, 1, SUNDAY, 7200))
+US_CENTRAL = Zone(-21600, -18000, (3, 2, SUNDAY, 7200), (11, 1, SUNDAY, 7200))
+US_MOUNTAIN = Zone(-25200, -21600, (3, 2, SUNDAY, 7200), (11, 1, SUNDAY, 7200))
+US_PACIFIC = Zone(-28800, -25200, (3, 2, SUNDAY, 7200), (11, 1, SUNDAY, 7200))
+## Southern hemisphere, DST around the turn of the year
+AU_EASTERN = Zone(36000, 39600, (10, 1, SUNDAY, 7200), (4, 1, SUNDAY, 10800))
@@ -0,0 +1,155 @@
+# -*- coding: utf-8 -*-
+
+"""
+Host-side compiler for the dot matrix fonts.
+
+Compiles the packed glyphs of src/characters.py into one binary font file that
+is read on the device by font_util.load(). Run with CPython:
+
+    python tools/font_compiler.py [-o src/characters.bin]
+
+File layout (little-endian):
+    header  : magic b'MXF1', face count (B), glyph count (H)
+    faces   : per face its name length (B) and name (ASCII)
+    index   : per glyph face number (B), code point (H), width (B),
+              height (B) and offset of its rows from the file start (H)
+    rows    : one bitmask byte per pixel row, see characters.py
+
+@author: mada
+@version: 2026-10-17
+"""
+
+import argparse
+import importlib.util
+import os
+import struct
+
+##*****************************************************************************
+##*****************************************************************************
+
+MAGIC = b'MXF1'
+HEADER = '<4sBH'
+INDEX_ENTRY = '<BHBBH'
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src')
+
+## Characters per face, mapped to the glyph names in characters.py
+FACES = (
+    ('big', (
+        ('0', 'big0'),         # 8 x14
+        ('1', 'big1'),         # 8 x14
+        ('2', 'big2'),         # 8 x14
+        ('3', 'big3'),         # 8 x14
+        ('4', 'big4'),         # 8 x14
+        ('5', 'big5'),         # 8 x14
+        ('6', 'big6'),         # 8 x14
+        ('7', 'big7'),         # 8 x14
+        ('8', 'big8'),         # 8 x14
+        ('9', 'big9'),         # 8 x14
+        ('.', 'big_dot'),      # 2 x14
+        (':', 'big_colon'),    # 2 x14
+        ('°', 'big_degree'),   # 4 x14
+        ('C', 'big_degreeC'),  # 8 x14
+        ('%', 'big_percent'),  # 8 x14
+        ('-', 'big_dash'),     # 8 x14
+        (' ', 'big_space'),    # 8 x14
+        ('~', 'pixel_black'),  # 1 x1
+        )),
+    ('small', (
+        ('0', 'small0'),         # 5 x7
+        ('1', 'small1'),         # 5 x7
+        ('2', 'small2'),         # 5 x7
+        ('3', 'small3'),         # 5 x7
+        ('4', 'small4'),         # 5 x7
+        ('5', 'small5'),         # 5 x7
+        ('6', 'small6'),         # 5 x7
+        ('7', 'small7'),         # 5 x7
+        ('8', 'small8'),         # 5 x7
+        ('9', 'small9'),         # 5 x7
+        ('.', 'small_dot'),      # 1 x7
+        (':', 'small_colon'),    # 1 x7
+        ('°', 'small_degree'),   # 3 x7
+        ('C', 'small_degreeC'),  # 6 x7
+        ('%', 'small_percent'),  # 5 x7
+        ('-', 'small_dash'),     # 4 x7
+        (' ', 'small_space'),    # 5 x7
+        ('~', 'pixel_black'),    # 1 x1
+        )),
+    )
+
+##*****************************************************************************
+##*****************************************************************************
+
+
+##=============================================================================
+def load_characters(path):
+    '''
+    Import the glyph definitions without putting src/ on the module path.
+
+    Returns
+    -------
+    module : module
+    '''
+    spec = importlib.util.spec_from_file_location('characters', path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+##=============================================================================
+def compile_fonts(characters, faces=FACES):
+    '''
+    Pack the glyphs of all faces into the binary font format.
+
+    Parameters
+    ----------
+    characters : module
+        Module with the packed glyphs, see characters.py.
+    faces : tuple
+        Face names with their (character, glyph name) pairs.
+
+    Returns
+    -------
+    data : bytes
+    '''
+    names = b''
+    glyphs = []
+    for face_no, (face, chars) in enumerate(faces):
+        name = face.encode('ascii')
+        names += struct.pack('<B', len(name)) + name
+        for char, glyph_name in chars:
+            width, height, rows = getattr(characters, glyph_name)
+            if not 0 < width <= 8 or len(rows) != height:
+                raise ValueError("glyph '{}' does not fit one byte per row".format(glyph_name))
+            glyphs.append((face_no, ord(char), width, height, bytes(rows)))
+
+    offset = struct.calcsize(HEADER) + len(names) + len(glyphs) * struct.calcsize(INDEX_ENTRY)
+    index = b''
+    rows = b''
+    for face_no, code, width, height, glyph_rows in glyphs:
+        index += struct.pack(INDEX_ENTRY, face_no, code, width, height, offset + len(rows))
+        rows += glyph_rows
+
+    header = struct.pack(HEADER, MAGIC, len(faces), len(glyphs))
+    return header + names + index + rows
+
+
+##=============================================================================
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0].strip())
+    parser.add_argument('-i', '--input', default=os.path.join(SRC_DIR, 'characters.py'),
+                        help="glyph definitions (default: src/characters.py)")
+    parser.add_argument('-o', '--output', default=os.path.join(SRC_DIR, 'characters.bin'),
+                        help="binary font file (default: src/characters.bin)")
+    args = parser.parse_args()
+
+    data = compile_fonts(load_characters(args.input))
+    with open(args.output, 'wb') as f:
+        f.write(data)
+    print(">> wrote {} bytes to {}".format(len(data), os.path.normpath(args.output)))
+
+
+##*****************************************************************************
+##*****************************************************************************
+if __name__ == '__main__':
+    main()
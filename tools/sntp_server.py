@@ -0,0 +1,270 @@
+# -*- coding: utf-8 -*-
+
+"""
+Local SNTP stand-in server for testing src/ntp_util.py.
+
+Answers SNTP client requests with the host time, optionally shifted by an
+offset, with a simulated network delay, and with a share of bogus answers.
+Run with CPython:
+
+    python tools/sntp_server.py [--port 12300] [--offset 0] [--delay 0] [--bogus 0]
+
+and query the running server from a second shell with ntp_util, passing
+the same port and offset:
+
+    python tools/sntp_server.py --check [--port 12300] [--offset 0] [--tolerance 0.1]
+
+The check fails with exit code 1 if the server time is off by more than the
+tolerance or if querying an unreachable server does not fail.
+
+Check the multi-server selection of ntp_util.best() against a set of fake
+servers on free ports, a good one, a slow one, one with a wrong time and one
+answering garbage:
+
+    python tools/sntp_server.py --check-servers
+
+@author: mada
+@version: 2026-10-17
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import socket
+import struct
+import sys
+import time
+
+##*****************************************************************************
+##*****************************************************************************
+
+PACKET = '!BBbb11I'
+PACKET_SIZE = 48
+NTP_DELTA = 2208988800  # 1900-01-01 to 1970-01-01
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src')
+
+
+##=============================================================================
+def timestamp(t):
+    '''
+    Convert a POSIX time to an NTP timestamp (seconds, fraction).
+    '''
+    seconds = int(t)
+    return seconds + NTP_DELTA, int((t - seconds) * (1 << 32)) & 0xFFFFFFFF
+
+
+##=============================================================================
+class SNTPServer(asyncio.DatagramProtocol):
+    '''
+    Stratum 1 server answering with the host time plus `offset` seconds.
+
+    Requests and replies are delayed by half of `delay` seconds each, like
+    by the network. A share `bogus` of the replies has a random time.
+    '''
+    def __init__(self, offset=0, delay=0, bogus=0):
+        self.offset = offset
+        self.delay = delay
+        self.bogus = bogus
+        self.requests = 0
+        self.transport = None
+        self._timers = set()
+
+    def connection_made(self, transport):
+        self.transport = transport
+
+    def connection_lost(self, exc):
+        ## drop the delayed replies and sends
+        for timer in self._timers:
+            timer.cancel()
+        self._timers.clear()
+        self.transport = None
+
+    def _later(self, delay, callback, *args):
+        '''
+        Call back after `delay` seconds, unless the connection is lost before.
+        '''
+        def run():
+            self._timers.discard(timer)
+            callback(*args)
+        timer = asyncio.get_running_loop().call_later(delay, run)
+        self._timers.add(timer)
+
+    def datagram_received(self, data, addr):
+        if len(data) < PACKET_SIZE or data[0] & 0x07 != 3:
+            return
+        self.requests += 1
+        self._later(self.delay / 2, self.reply, data, addr)
+
+    def reply(self, data, addr):
+        fields = struct.unpack(PACKET, data[:PACKET_SIZE])
+        version = fields[0] >> 3 & 0x07
+        received = transmit = time.time() + self.offset
+        if random.random() < self.bogus:
+            received = transmit = random.uniform(0, (1 << 32) - NTP_DELTA)
+        packet = struct.pack(
+            PACKET,
+            version << 3 | 4,  # no leap second warning, server mode
+            1,  # stratum
+            fields[2],  # poll
+            -20,  # precision
+            0, 0,  # root delay and dispersion
+            int.from_bytes(b'LOCL', 'big'),  # reference id
+            *timestamp(received),  # reference
+            fields[13], fields[14],  # originate = client transmit timestamp
+            *timestamp(received),
+            *timestamp(transmit))
+        self._later(self.delay / 2, self.send, packet, addr)
+
+    def send(self, packet, addr):
+        if self.transport is not None and not self.transport.is_closing():
+            self.transport.sendto(packet, addr)
+
+
+##=============================================================================
+async def serve(host, port, offset=0, delay=0, bogus=0):
+    '''
+    Start a server in the running event loop.
+
+    Returns
+    -------
+    transport : asyncio.DatagramTransport
+    server : SNTPServer
+    '''
+    return await asyncio.get_running_loop().create_datagram_endpoint(
+        lambda: SNTPServer(offset, delay, bogus), local_addr=(host, port))
+
+
+##=============================================================================
+def free_port(host):
+    '''
+    Return a UDP port nobody listens on.
+    '''
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+        sock.bind((host, 0))
+        return sock.getsockname()[1]
+
+
+##=============================================================================
+async def check(args):
+    '''
+    Query a running server with ntp_util and compare against the host time.
+
+    Returns
+    -------
+    failed : int
+        Number of failed checks.
+    '''
+    sys.path.insert(0, SRC_DIR)
+    import ntp_util
+
+    failed = 0
+    addr = ntp_util.resolve(args.host, args.port)
+    try:
+        seconds, ms, delay_ms, ticks = await ntp_util.query(addr, timeout=args.delay + 1)
+    except asyncio.TimeoutError:
+        print("!! no reply from {}:{}".format(args.host, args.port))
+        failed += 1
+    else:
+        error = seconds + (ms + ntp_util.ticks_diff(ntp_util.ticks_ms(), ticks)) / 1000 - time.time() - args.offset
+        ok = abs(error) <= args.tolerance
+        failed += not ok
+        print("{} server time {}.{:03d}, delay {}ms, error {:+.3f}s".format('<<' if ok else '!!', seconds, ms, delay_ms, error))
+
+    ## no server on a free port: retries with backoff, never blocking
+    t_start = time.monotonic()
+    sample = await ntp_util.sync([ntp_util.resolve(args.host, free_port(args.host))], attempts=3, timeout=0.2, backoff=0.1)
+    ok = sample is None
+    failed += not ok
+    print("{} unreachable server: {} after {:.1f}s".format('<<' if ok else '!!', sample, time.monotonic() - t_start))
+    return failed
+
+
+##=============================================================================
+async def check_servers(args):
+    '''
+    Query a set of fake servers with ntp_util.best() and check the selection.
+    '''
+    sys.path.insert(0, SRC_DIR)
+    import ntp_util
+
+    ## (offset, delay, bogus) per server
+    servers = (
+        (0, 0.02, 0),  # good
+        (0, 0.8, 0),  # good, but slow
+        (3600, 0.01, 0),  # wrong time, fastest
+        (0, 0.01, 1),  # garbage
+        (0, 0.04, 0.3),  # good, sometimes garbage
+        )
+    transports = []
+    try:
+        addrs = []
+        for i, (offset, delay, bogus) in enumerate(servers):
+            transport, server = await serve(args.host, 0, offset, delay, bogus)
+            transports.append(transport)
+            addrs.append(ntp_util.resolve(args.host, transport.get_extra_info('sockname')[1]))
+
+        failed = 0
+        early = 0
+        for _ in range(args.rounds):
+            t_start = time.monotonic()
+            sample = await ntp_util.best(addrs, rounds=3, timeout=1, quorum=2, good_delay_ms=50)
+            duration = time.monotonic() - t_start
+            if sample is None:
+                print("!! no sample after {:.2f}s".format(duration))
+                failed += 1
+                continue
+            seconds, ms, delay_ms, ticks = sample
+            error = seconds + (ms + ntp_util.ticks_diff(ntp_util.ticks_ms(), ticks)) / 1000 - time.time()
+            ok = abs(error) < 0.1
+            failed += not ok
+            ## without waiting for the slow server, unless the flaky one only answered garbage
+            early += duration < 0.8
+            print("{} delay {}ms, error {:+.3f}s after {:.2f}s".format('<<' if ok else '!!', delay_ms, error, duration))
+        print(">> {} of {} syncs failed, {} returned early".format(failed, args.rounds, early))
+        return failed
+    finally:
+        for transport in transports:
+            transport.close()
+
+
+##=============================================================================
+async def run(args):
+    transport, server = await serve(args.host, args.port, args.offset, args.delay, args.bogus)
+    print(">> serving SNTP on {}:{} (offset {}s, delay {}s, bogus {})".format(args.host, args.port, args.offset, args.delay, args.bogus))
+    try:
+        await asyncio.Event().wait()
+    finally:
+        transport.close()
+
+
+##=============================================================================
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0].strip())
+    parser.add_argument('--host', default='127.0.0.1', help="address to bind (default: 127.0.0.1)")
+    parser.add_argument('--port', type=int, default=12300, help="UDP port (default: 12300)")
+    parser.add_argument('--offset', type=float, default=0, help="seconds added to the host time (default: 0)")
+    parser.add_argument('--delay', type=float, default=0, help="simulated network round-trip in seconds (default: 0)")
+    parser.add_argument('--bogus', type=float, default=0, help="share of replies with a random time (default: 0)")
+    parser.add_argument('--check', action='store_true', help="query a running server once with ntp_util and exit")
+    parser.add_argument('--tolerance', type=float, default=0.1, help="seconds of error accepted by --check (default: 0.1)")
+    parser.add_argument('--check-servers', action='store_true',
+                        help="check ntp_util.best() against fake servers on free ports and exit")
+    parser.add_argument('--rounds', type=int, default=10, help="syncs for --check-servers (default: 10)")
+    args = parser.parse_args()
+
+    try:
+        if args.check_servers:
+            sys.exit(1 if asyncio.run(check_servers(args)) else 0)
+        if args.check:
+            sys.exit(1 if asyncio.run(check(args)) else 0)
+        asyncio.run(run(args))
+    except KeyboardInterrupt:
+        pass
+
+
+##*****************************************************************************
+##*****************************************************************************
+if __name__ == '__main__':
+    main()